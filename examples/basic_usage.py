@@ -11,8 +11,7 @@ import asyncio
 from src.core.state import initialize_match_state
 from src.agents.router import route_query
 from src.agents.stats_agent import get_stats_response_async
-from src.agents.event_handler import process_event
-import json
+from src.agents.event_handler import process_event_dict
 
 
 async def example_basic_usage():
@@ -53,8 +52,8 @@ async def example_basic_usage():
         "commentary": "Sudharsan drives through covers for four"
     }
     
-    event_json = json.dumps(sample_event)
-    new_state = await process_event(event_json, state)
+    # Already a dict, so skip the JSON round-trip (use process_event for JSON strings)
+    new_state = process_event_dict(sample_event, state)
     print(f"   New state: {new_state.total_runs}/{new_state.wickets_lost}")
     print(f"   P(Draw): {new_state.p_draw:.2%}")
     
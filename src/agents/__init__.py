@@ -10,19 +10,35 @@ This package contains specialized agents that handle different types of queries:
 - Tactical Agent: Provides tactical analysis
 """
 
-from .router import route_query, QUERY_EXAMPLES
-from .event_handler import validate_event, update_state, process_event
-from .stats_agent import get_stats_response, get_stats_response_async
-from .momentum_agent import get_momentum_response_async
-from .probability_agent import get_probability_response_async
-from .tactical_agent import get_tactical_response_async
+import importlib
+
+# Attributes are imported on first access (PEP 562), so e.g.
+# `from src.agents import process_event` doesn't pull in the LLM stack.
+_LAZY = {
+    "route_query": "router",
+    "QUERY_EXAMPLES": "router",
+    "validate_event": "event_handler",
+    "update_state": "event_handler",
+    "update_state_batch": "event_handler",
+    "process_event": "event_handler",
+    "process_event_sync": "event_handler",
+    "process_event_dict": "event_handler",
+    "get_stats_response": "stats_agent",
+    "get_stats_response_async": "stats_agent",
+    "get_momentum_response_async": "momentum_agent",
+    "get_probability_response_async": "probability_agent",
+    "get_tactical_response_async": "tactical_agent",
+}
 
 __all__ = [
     "route_query",
     "QUERY_EXAMPLES",
     "validate_event",
     "update_state",
+    "update_state_batch",
     "process_event",
+    "process_event_sync",
+    "process_event_dict",
     "get_stats_response",
     "get_stats_response_async",
     "get_momentum_response_async",
@@ -30,3 +46,16 @@ __all__ = [
     "get_tactical_response_async",
 ]
 
+
+def __getattr__(name: str):
+    """Import the submodule that defines `name` and cache the attribute."""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module = importlib.import_module(f".{_LAZY[name]}", __name__)
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,69 @@
+"""
+Single-pass keyword scanner shared by the router and keyword fallbacks.
+
+Agents decide what a query is about by checking which keywords appear in
+it (plain substring matching). Instead of one `in` test per keyword, a
+KeywordScanner finds all of them in one regex pass and returns a bitmask,
+so each branch becomes an integer test.
+"""
+
+import re
+from typing import Dict, Iterable
+
+
+class KeywordScanner:
+    """
+    Finds which keywords occur as substrings of a text in one pass.
+
+    Example:
+        >>> scanner = KeywordScanner(["run", "win"])
+        >>> RUN, WIN = scanner.mask("run"), scanner.mask("win")
+        >>> flags = scanner.scan("runs to win?")
+        >>> bool(flags & RUN and flags & WIN)
+        True
+    """
+
+    def __init__(self, keywords: Iterable[str]):
+        """
+        Compile the scanner.
+
+        Args:
+            keywords: Lowercase keywords to look for
+        """
+        keywords = list(dict.fromkeys(keywords))
+        self.bits: Dict[str, int] = {keyword: 1 << i for i, keyword in enumerate(keywords)}
+
+        # A zero-width lookahead tries every position, so overlapping keywords
+        # are all found. Only the longest keyword is captured at a position,
+        # so a match also sets the bits of any keywords that are its prefixes.
+        self._match_masks: Dict[str, int] = {
+            keyword: self.mask(*(other for other in keywords if keyword.startswith(other)))
+            for keyword in keywords
+        }
+        self._pattern = re.compile(
+            "(?=({}))".format(
+                "|".join(re.escape(k) for k in sorted(keywords, key=len, reverse=True))
+            )
+        )
+
+    def mask(self, *keywords: str) -> int:
+        """Return the combined bit mask for the given keywords."""
+        flags = 0
+        for keyword in keywords:
+            flags |= self.bits[keyword]
+        return flags
+
+    def scan(self, text: str) -> int:
+        """
+        Scan lowercase text and return the mask of keywords it contains.
+
+        Args:
+            text: Text to scan (callers lowercase it first)
+
+        Returns:
+            int: Bitwise OR of the bits of every keyword found
+        """
+        flags = 0
+        for match in self._pattern.finditer(text):
+            flags |= self._match_masks[match.group(1)]
+        return flags
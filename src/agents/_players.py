@@ -0,0 +1,70 @@
+"""
+Name lookup for dismissed players, shared by the keyword fallbacks.
+
+Fallback answers look for a dismissed player mentioned in the query. The
+lowercased name index is built once per dismissed_players tuple (a new
+tuple is only created when a wicket falls) instead of lowercasing every
+name on every query.
+"""
+
+import re
+from typing import Dict, Optional
+
+from src.core.state import DismissedPlayer, MatchState
+
+_TOKEN_RE = re.compile(r"[a-z]+")
+
+# Common misspellings users type, mapped to the name token they mean
+_NAME_ALIASES = {"jasiwal": "jaiswal"}
+
+# Name tokens shorter than this (initials, "c", "wk") are not indexed
+_MIN_TOKEN_LEN = 3
+
+# Name tokens that are also everyday query words ("will India draw")
+_STOPWORDS = frozenset({
+    "and", "are", "bat", "day", "did", "draw", "for", "get", "got", "how",
+    "out", "run", "runs", "score", "the", "van", "was", "what", "who",
+    "why", "will", "win",
+})
+
+# The dismissed_players tuple the index was built from, and the index
+_indexed_players = None
+_name_index: Dict[str, DismissedPlayer] = {}
+
+
+def _dismissed_name_index(state: MatchState) -> Dict[str, DismissedPlayer]:
+    """Map each lowercased name token to the first dismissed player with it.
+
+    Initials and tokens that double as common query words are skipped.
+    """
+    global _indexed_players, _name_index
+    players = state.dismissed_players
+    if players is not _indexed_players:
+        index: Dict[str, DismissedPlayer] = {}
+        for player in players:
+            for token in _TOKEN_RE.findall(player.name.lower()):
+                if len(token) >= _MIN_TOKEN_LEN and token not in _STOPWORDS:
+                    index.setdefault(token, player)
+        _indexed_players, _name_index = players, index
+    return _name_index
+
+
+def find_dismissed_player(state: MatchState, query_lower: str) -> Optional[DismissedPlayer]:
+    """
+    Find the dismissed player a query mentions by first or last name.
+
+    Args:
+        state: Current match state
+        query_lower: Lowercased user query
+
+    Returns:
+        DismissedPlayer: First player named in the query, or None
+    """
+    index = _dismissed_name_index(state)
+    if not index:
+        return None
+    for token in _TOKEN_RE.findall(query_lower):
+        player = index.get(_NAME_ALIASES.get(token, token))
+        if player is not None:
+            return player
+    return None
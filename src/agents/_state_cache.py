@@ -0,0 +1,62 @@
+"""
+Request-scoped cache for agent state serialization.
+
+Each agent converts MatchState into a dict for LLM context. Within a single
+user query the state does not change, so the conversion only needs to run
+once per agent. The cache lives in a ContextVar and is only active inside
+request_scope(); outside of it every call rebuilds the dict as before.
+"""
+
+import functools
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from src.core.state import MatchState
+
+_request_cache: ContextVar[Optional[Dict[Tuple[Any, ...], dict]]] = ContextVar(
+    "_request_cache", default=None
+)
+
+
+@contextmanager
+def request_scope():
+    """
+    Open a fresh state-dict cache for the duration of one query.
+
+    Example:
+        >>> with request_scope():
+        ...     response = await get_stats_response_async(state, query)
+    """
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
+
+
+def request_cached(agent_type: str) -> Callable[[Callable[[MatchState], dict]], Callable[[MatchState], dict]]:
+    """
+    Memoize an agent's _state_to_dict within the current request scope.
+
+    Args:
+        agent_type: Agent name, keeps each agent's dict separate
+
+    Returns:
+        Decorator for a (MatchState) -> dict function
+    """
+    def decorator(build: Callable[[MatchState], dict]) -> Callable[[MatchState], dict]:
+        @functools.wraps(build)
+        def wrapper(state: MatchState) -> dict:
+            cache = _request_cache.get()
+            if cache is None:
+                return build(state)
+
+            key = (agent_type, id(state), state.last_updated)
+            if key not in cache:
+                cache[key] = build(state)
+            return cache[key]
+
+        return wrapper
+
+    return decorator
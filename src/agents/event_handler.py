@@ -12,12 +12,53 @@ The event handler is responsible for:
 4. Tracking dismissed players
 """
 
-import json
-from typing import Dict, Any
+import functools
+from typing import Dict, Any, Optional, Sequence, Union
 from datetime import datetime
 
-from src.core.state import Event, MatchState, DismissedPlayer
-from src.core.probability import update_probability
+from src.core.state import Event, MatchState, DismissedPlayer, MOMENTUM_WINDOW
+from src.core.probability import update_probability, replay_probability
+
+# Optional fast JSON parser: orjson, then ujson, then the stdlib (all accept bytes)
+# Each one's decode error subclasses ValueError
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    try:
+        from ujson import loads as _json_loads
+    except ImportError:
+        from json import loads as _json_loads
+
+# Optional typed decoder: parses JSON straight into an Event in one pass
+# (no intermediate dict); anything it rejects goes through the dict path
+try:
+    import msgspec
+except ImportError:
+    msgspec = None
+
+# Optional C parser for ISO-8601 timestamps (falls back to the stdlib)
+try:
+    from ciso8601 import parse_datetime as _parse_iso_datetime
+except ImportError:
+    _parse_iso_datetime = datetime.fromisoformat
+
+# Fields every event must carry (tuple keeps error messages in a stable order)
+_REQUIRED_FIELD_ORDER = ("event_type", "timestamp", "current_score", "current_wickets", "overs_played")
+_REQUIRED_FIELDS = frozenset(_REQUIRED_FIELD_ORDER)
+
+# strict=False accepts numeric strings for numeric fields, like Event.from_api
+_event_decoder = msgspec.json.Decoder(Event, strict=False) if msgspec is not None else None
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_timestamp(timestamp: str) -> datetime:
+    """
+    Parse an ISO-8601 timestamp string.
+    
+    Cached because replayed and re-polled events repeat the same strings;
+    datetimes are immutable, so sharing the parsed value is safe.
+    """
+    return _parse_iso_datetime(timestamp)
 
 
 def validate_event(event_dict: Dict[str, Any]) -> Event:
@@ -36,20 +77,40 @@ def validate_event(event_dict: Dict[str, Any]) -> Event:
     Raises:
         ValueError: If required fields are missing
     """
-    required_fields = ["event_type", "timestamp", "current_score", "current_wickets", "overs_played"]
-    
-    for field in required_fields:
-        if field not in event_dict:
-            raise ValueError(f"Missing required field: {field}")
+    # One set difference instead of a membership test per field
+    missing = _REQUIRED_FIELDS - event_dict.keys()
+    if missing:
+        field = next(name for name in _REQUIRED_FIELD_ORDER if name in missing)
+        raise ValueError(f"Missing required field: {field}")
     
     # Parse timestamp if it's a string
     if isinstance(event_dict.get("timestamp"), str):
         try:
-            event_dict["timestamp"] = datetime.fromisoformat(event_dict["timestamp"])
+            event_dict["timestamp"] = _parse_timestamp(event_dict["timestamp"])
         except ValueError as e:
             raise ValueError(f"Invalid timestamp format: {e}")
     
-    return Event(**event_dict)
+    return Event.from_api(event_dict)
+
+
+def _decode_event(event_json: Union[str, bytes]) -> Optional[Event]:
+    """
+    Decode and type-check a JSON event with msgspec, if it is installed.
+    
+    Returns None when msgspec is unavailable or rejects the input; the
+    caller then takes the dict path, which also produces the error message.
+    Strings aren't interned here, so equality checks on event_type just
+    compare characters.
+    """
+    if _event_decoder is None:
+        return None
+    try:
+        event = _event_decoder.decode(event_json)
+    except (msgspec.ValidationError, msgspec.DecodeError):
+        return None
+    if not 1 <= event.balls_in_over <= 6:
+        return None
+    return event
 
 
 def update_state(state: MatchState, event: Event) -> MatchState:
@@ -97,21 +158,19 @@ def update_state(state: MatchState, event: Event) -> MatchState:
     new_p_draw = update_probability(state.p_draw, event, state)
     
     # Track dismissed players when wicket falls
-    dismissed_players = state.dismissed_players.copy()  # Copy existing dismissed players
+    # Tuples are immutable, so non-wicket events share the previous tuple as-is
+    dismissed_players = state.dismissed_players
     if event.event_type == "wicket" and event.batter:
         # Calculate runs scored by dismissed batter
         # This is approximate - ideally we'd track individual scores better
-        dismissed_runs = 0
         if state.current_batter.name == event.batter:
             dismissed_runs = state.current_batter.runs
         else:
-            # Try to find from recent events
-            for prev_event in reversed(state.recent_events):
-                if prev_event.batter == event.batter and prev_event.event_type == "runs":
-                    dismissed_runs += prev_event.runs_scored
+            # Running total kept by update_state (no scan of the event history)
+            dismissed_runs = state.per_batter_runs.get(event.batter, 0)
         
-        # Add dismissed player to history
-        dismissed_players.append(
+        # Add dismissed player to history (only wickets allocate a new tuple)
+        dismissed_players = dismissed_players + (
             DismissedPlayer(
                 name=event.batter,
                 runs=dismissed_runs,
@@ -121,11 +180,36 @@ def update_state(state: MatchState, event: Event) -> MatchState:
                 fielder=event.fielder,
                 dismissed_at_score=event.current_score,
                 dismissed_at_overs=event.overs_played
-            )
+            ),
         )
     
-    # Rebuild state from scratch (safer than copy() - avoids shallow copy issues with recent_events list)
-    # This ensures recent_events is a new list, not a shared reference
+    # Keep a running per-batter total so wickets don't have to scan past events
+    # Copy before updating so the previous state keeps its own totals
+    per_batter_runs = state.per_batter_runs
+    if event.event_type == "runs" and event.batter:
+        per_batter_runs = dict(per_batter_runs)
+        per_batter_runs[event.batter] = per_batter_runs.get(event.batter, 0) + event.runs_scored
+    
+    # Slide the momentum window: add the new event, drop the one falling out
+    recent_wickets_10 = state.recent_wickets_10
+    recent_runs_10 = state.recent_runs_10
+    if event.event_type == "wicket":
+        recent_wickets_10 += 1
+    elif event.event_type == "runs":
+        recent_runs_10 += event.runs_scored
+    if len(state.recent_events) >= MOMENTUM_WINDOW:
+        dropped = state.recent_events[-MOMENTUM_WINDOW]
+        if dropped.event_type == "wicket":
+            recent_wickets_10 -= 1
+        elif dropped.event_type == "runs":
+            recent_runs_10 -= dropped.runs_scored
+    
+    # Append to a copy of the bounded event log (O(MAX_RECENT_EVENTS), not O(match length))
+    # The old state keeps its own deque, so states never share a mutable reference
+    recent_events = state.recent_events.copy()
+    recent_events.append(event)
+    
+    # Rebuild state from scratch (safer than copy() - avoids shallow copy issues with recent_events)
     new_state = MatchState(
         match_id=state.match_id,
         team_batting=state.team_batting,
@@ -135,24 +219,142 @@ def update_state(state: MatchState, event: Event) -> MatchState:
         target=state.target,
         current_batter=state.current_batter,  # Update this if batter changed (future enhancement)
         dismissed_players=dismissed_players,
-        recent_events=state.recent_events + [event],  # New list (not shared reference)
+        recent_events=recent_events,
+        per_batter_runs=per_batter_runs,
+        recent_wickets_10=recent_wickets_10,
+        recent_runs_10=recent_runs_10,
         p_draw=new_p_draw,
-        p_sa_win=1.0 - new_p_draw,
         last_updated=event.timestamp
     )
     
     return new_state
 
 
-async def process_event(event_json: str, state: MatchState) -> MatchState:
+def update_state_batch(state: MatchState, events: Sequence[Event]) -> MatchState:
+    """
+    Apply several consecutive events and build a single new MatchState.
+    
+    Produces the same state as calling update_state once per event, but
+    copies the event log, per-batter totals and dismissed list once for the
+    whole batch instead of once per event. Useful when polling catches up
+    on a burst of events.
+    
+    Args:
+        state: Current match state
+        events: New events, in the order they occurred
+    
+    Returns:
+        MatchState: Updated match state (state itself if events is empty)
+    
+    Raises:
+        ValueError: If any state transition is invalid (no state is built)
+    """
+    if not events:
+        return state
+    
+    wickets_lost = state.wickets_lost
+    overs_played = state.overs_played
+    dismissed = []
+    per_batter_runs = state.per_batter_runs
+    per_batter_copied = False
+    
+    for event in events:
+        # Same checks as update_state, against the running position
+        if event.runs_scored < 0:
+            raise ValueError("Runs cannot be negative")
+        if event.overs_played < overs_played:
+            raise ValueError(
+                f"Overs went backwards: {overs_played} → {event.overs_played}"
+            )
+        if event.event_type == "wicket":
+            if wickets_lost + 1 > 10:
+                raise ValueError("Cannot lose more than 10 wickets")
+            
+            if event.batter:
+                if state.current_batter.name == event.batter:
+                    dismissed_runs = state.current_batter.runs
+                else:
+                    dismissed_runs = per_batter_runs.get(event.batter, 0)
+                dismissed.append(
+                    DismissedPlayer(
+                        name=event.batter,
+                        runs=dismissed_runs,
+                        balls_faced=0,  # Not tracked in events
+                        dismissal_mode=event.dismissal_mode or "unknown",
+                        bowler=event.bowler or "unknown",
+                        fielder=event.fielder,
+                        dismissed_at_score=event.current_score,
+                        dismissed_at_overs=event.overs_played
+                    )
+                )
+        elif event.event_type == "runs" and event.batter:
+            # Copy once per batch so the previous state keeps its own totals
+            if not per_batter_copied:
+                per_batter_runs = dict(per_batter_runs)
+                per_batter_copied = True
+            per_batter_runs[event.batter] = per_batter_runs.get(event.batter, 0) + event.runs_scored
+        
+        wickets_lost, overs_played = event.current_wickets, event.overs_played
+    
+    recent_events = state.recent_events.copy()
+    recent_events.extend(events)
+    last = events[-1]
+    
+    # Momentum counters are left out so MatchState recounts its last window
+    return MatchState(
+        match_id=state.match_id,
+        team_batting=state.team_batting,
+        total_runs=last.current_score,
+        wickets_lost=last.current_wickets,
+        overs_played=last.overs_played,
+        target=state.target,
+        current_batter=state.current_batter,
+        dismissed_players=state.dismissed_players + tuple(dismissed) if dismissed else state.dismissed_players,
+        recent_events=recent_events,
+        per_batter_runs=per_batter_runs,
+        p_draw=replay_probability(state.p_draw, events, state.wickets_lost, state.overs_played),
+        last_updated=last.timestamp
+    )
+
+
+def process_event_dict(event_dict: Dict[str, Any], state: MatchState) -> MatchState:
+    """
+    Process an already-parsed event dictionary and update match state.
+    
+    Use this for in-process callers that already hold a dict, so the
+    event doesn't have to be serialized to JSON and parsed back.
+    
+    Args:
+        event_dict: Dictionary containing event data
+        state: Current match state
+    
+    Returns:
+        MatchState: Updated match state
+    
+    Raises:
+        ValueError: If event validation fails
+    """
+    # Validate and create event
+    event = validate_event(event_dict)
+    
+    # Update state
+    new_state = update_state(state, event)
+    
+    return new_state
+
+
+def process_event_sync(event_json: Union[str, bytes], state: MatchState) -> MatchState:
     """
     Process a JSON event string and update match state.
     
     This is the main entry point for processing events from manual input.
     It handles JSON parsing, validation, and state updates.
     
+    All of the work is CPU-bound, so this is a plain function; use it
+    directly from sync code or hot loops to skip coroutine overhead.
+    
     Args:
-        event_json: JSON string containing event data
+        event_json: JSON string (or bytes) containing event data
         state: Current match state
     
     Returns:
@@ -160,19 +362,33 @@ async def process_event(event_json: str, state: MatchState) -> MatchState:
     
     Raises:
         ValueError: If JSON is invalid or event validation fails
-        json.JSONDecodeError: If JSON cannot be parsed
     """
+    # Fast path: parse and validate in one typed decode
+    event = _decode_event(event_json)
+    if event is not None:
+        return update_state(state, event)
+    
     try:
         # Parse JSON
-        event_dict = json.loads(event_json)
-    except json.JSONDecodeError as e:
+        event_dict = _json_loads(event_json)
+    except ValueError as e:
         raise ValueError(f"Invalid JSON format: {e}")
     
-    # Validate and create event
-    event = validate_event(event_dict)
+    return process_event_dict(event_dict, state)
+
+
+async def process_event(event_json: Union[str, bytes], state: MatchState) -> MatchState:
+    """
+    Async wrapper around process_event_sync, kept for backward compatibility.
     
-    # Update state
-    new_state = update_state(state, event)
+    Args:
+        event_json: JSON string (or bytes) containing event data
+        state: Current match state
     
-    return new_state
-
+    Returns:
+        MatchState: Updated match state
+    
+    Raises:
+        ValueError: If JSON is invalid or event validation fails
+    """
+    return process_event_sync(event_json, state)
@@ -6,14 +6,16 @@ Falls back to simple logic if OpenAI unavailable.
 """
 
 from src.core.state import MatchState
-from src.services.llm_client import get_intelligent_response
+from src.services.llm_batcher import batcher
+from src.agents._state_cache import request_cached
 
 
+@request_cached("momentum")
 def _state_to_dict(state: MatchState) -> dict:
     """Convert MatchState to dictionary for LLM context."""
     # Get recent events summary
     recent_events_summary = []
-    for event in state.recent_events[-5:]:  # Last 5 events
+    for event in state.tail_events(5):  # Last 5 events
         if event.event_type == "wicket":
             recent_events_summary.append(f"{event.batter} dismissed by {event.bowler}")
         elif event.event_type == "runs" and event.runs_scored >= 4:
@@ -33,12 +35,10 @@ def _state_to_dict(state: MatchState) -> dict:
 
 def _get_fallback_response(state: MatchState) -> str:
     """Fallback momentum analysis using simple logic."""
-    recent_wickets = sum(1 for e in state.recent_events[-10:] if e.event_type == "wicket")
-    recent_runs = sum(e.runs_scored for e in state.recent_events[-10:] if e.event_type == "runs")
-    
-    if recent_wickets > 0:
+    # Counters over the last 10 events are maintained by update_state
+    if state.recent_wickets_10 > 0:
         return "South Africa has momentum with recent wickets."
-    elif recent_runs >= 20:
+    elif state.recent_runs_10 >= 20:
         return "India building momentum with good scoring."
     else:
         return "Match is balanced, both teams fighting."
@@ -61,7 +61,7 @@ async def get_momentum_response_async(state: MatchState, query: str = "") -> str
     state_data = _state_to_dict(state)
     
     try:
-        intelligent_response = await get_intelligent_response(query, state_data, agent_type="momentum")
+        intelligent_response = await batcher.submit(query, state_data, agent_type="momentum")
         if intelligent_response:
             return intelligent_response
     except Exception:
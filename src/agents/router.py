@@ -11,30 +11,78 @@ Uses simple keyword matching (no LLM required for MVP).
 This is fast, deterministic, and doesn't require external API calls.
 """
 
+import functools
 
-# Query examples and expected routing for testing
-QUERY_EXAMPLES = {
-    "What's the score?": "stats",
-    "How many runs has Jaiswal scored?": "stats",
-    "Who is batting now?": "stats",
-    "What just happened?": "momentum",
-    "Is India in trouble?": "momentum",
-    "Who has the momentum?": "momentum",
-    "Can India draw?": "probability",
-    "What are India's chances?": "probability",
-    "What's the win probability?": "probability",
-    "Why did Jaiswal get out?": "tactical",
-    "What was the dismissal?": "tactical",
-    "How was Sudharsan dismissed?": "tactical",
-}
+from src.agents._keywords import KeywordScanner
 
 
+def _query_examples() -> dict:
+    """
+    Query examples and expected routing for testing.
+    
+    Built on demand (only test_router and callers of QUERY_EXAMPLES need it),
+    so importing the router doesn't allocate the table.
+    """
+    return {
+        "What's the score?": "stats",
+        "How many runs has Jaiswal scored?": "stats",
+        "Who is batting now?": "stats",
+        "What just happened?": "momentum",
+        "Is India in trouble?": "momentum",
+        "Who has the momentum?": "momentum",
+        "Can India draw?": "probability",
+        "What are India's chances?": "probability",
+        "What's the win probability?": "probability",
+        "Why did Jaiswal get out?": "tactical",
+        "What was the dismissal?": "tactical",
+        "How was Sudharsan dismissed?": "tactical",
+    }
+
+
+def __getattr__(name: str):
+    # Keep `from src.agents.router import QUERY_EXAMPLES` working (PEP 562)
+    if name == "QUERY_EXAMPLES":
+        return _query_examples()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Keyword tables, in routing priority order
+STATS_KEYWORDS = frozenset(["score", "runs", "wickets", "overs", "batting"])
+PROBABILITY_KEYWORDS = frozenset(["chance", "draw", "win", "probability", "odds", "likely"])
+MOMENTUM_KEYWORDS = frozenset(["momentum", "happening", "happened", "situation", "trouble", "doing"])
+TACTICAL_KEYWORDS = frozenset(["dismissed", "dismissal"])
+
+# Words only used in the special-case checks below
+_MODIFIER_KEYWORDS = frozenset(["run", "who", "why", "how", "out"])
+
+# All keywords are found in one pass over the query
+_SCANNER = KeywordScanner(
+    sorted(
+        STATS_KEYWORDS | PROBABILITY_KEYWORDS | MOMENTUM_KEYWORDS
+        | TACTICAL_KEYWORDS | _MODIFIER_KEYWORDS
+    )
+)
+_STATS = _SCANNER.mask(*STATS_KEYWORDS)
+_PROBABILITY = _SCANNER.mask(*PROBABILITY_KEYWORDS)
+_MOMENTUM = _SCANNER.mask(*MOMENTUM_KEYWORDS)
+_TACTICAL = _SCANNER.mask(*TACTICAL_KEYWORDS)
+_RUN = _SCANNER.mask("run")
+_WIN = _SCANNER.mask("win")
+_WHO = _SCANNER.mask("who")
+_MOMENTUM_WORD = _SCANNER.mask("momentum")
+_WHY_HOW = _SCANNER.mask("why", "how")
+_OUT = _SCANNER.mask("out")
+
+
+@functools.lru_cache(maxsize=256)
 def route_query(query: str) -> str:
     """
     Classify user query into a category.
     
     Uses simple keyword matching to route queries to appropriate agents.
-    This is fast, deterministic, and doesn't require LLM calls.
+    All keywords are found in one scan with a precompiled pattern, then
+    the category is picked with bitmask tests on the keywords present.
+    Routing is deterministic, so results are cached for repeated queries.
     
     Order matters: Check more specific categories first to avoid false matches.
     
@@ -51,40 +99,37 @@ def route_query(query: str) -> str:
         >>> route_query("Can India draw?")
         'probability'
     """
-    query_lower = query.lower()
+    flags = _SCANNER.scan(query.lower())
     
     # Stats queries: Check first (most common, and "runs", "score" are unambiguous)
     # Looking for scorecard data
-    stats_keywords = ["score", "runs", "wickets", "overs", "batting"]
-    if any(keyword in query_lower for keyword in stats_keywords):
+    if flags & _STATS:
         return "stats"
     
     # Special case: "runs to win" or "runs needed" should be stats, not probability
-    if ("run" in query_lower or "runs" in query_lower) and "win" in query_lower:
+    if flags & _RUN and flags & _WIN:
         return "stats"
     
     # Check "who" separately - only if not asking about momentum
-    if "who" in query_lower and "momentum" not in query_lower:
+    if flags & _WHO and not flags & _MOMENTUM_WORD:
         return "stats"
     
     # Probability queries: Check before tactical/momentum
     # Looking for win/draw chances (but not if asking about runs to win)
-    probability_keywords = ["chance", "draw", "win", "probability", "odds", "likely"]
-    if any(keyword in query_lower for keyword in probability_keywords):
+    if flags & _PROBABILITY:
         return "probability"
     
     # Momentum queries: Check before tactical
     # Looking for narrative/context
-    momentum_keywords = ["momentum", "happening", "happened", "situation", "trouble", "doing"]
-    if any(keyword in query_lower for keyword in momentum_keywords):
+    if flags & _MOMENTUM:
         return "momentum"
     
     # Tactical queries: Check last (most specific)
     # Looking for specific dismissal/strategy analysis
     # Match "how" or "why" only if combined with dismissal-related words
-    if any(word in query_lower for word in ["dismissed", "dismissal"]):
+    if flags & _TACTICAL:
         return "tactical"
-    if ("why" in query_lower or "how" in query_lower) and "out" in query_lower:
+    if flags & _WHY_HOW and flags & _OUT:
         return "tactical"
     
     # Default to stats if no match found
@@ -101,7 +146,7 @@ def test_router():
     print("Testing query router...")
     all_passed = True
     
-    for query, expected_category in QUERY_EXAMPLES.items():
+    for query, expected_category in _query_examples().items():
         result = route_query(query)
         if result != expected_category:
             print(f"❌ FAILED: '{query}' -> Expected '{expected_category}', got '{result}'")
@@ -10,9 +10,35 @@ and provides natural responses.
 
 import asyncio
 from src.core.state import MatchState
-from src.services.llm_client import get_intelligent_response
+from src.services.llm_batcher import batcher
+from src.services._loop import run_sync
+from src.agents._state_cache import request_cached
+from src.agents._keywords import KeywordScanner
+from src.agents._players import find_dismissed_player
 
+# Every word the keyword fallback looks for, found in one pass per query
+_SCANNER = KeywordScanner([
+    "wicket", "remain", "remian", "left", "lost", "bat", "who", "is", "run",
+    "need", "require", "win", "score", "total", "out", "dismiss", "how", "what",
+    "when", "over", "target",
+])
+_WICKET = _SCANNER.mask("wicket")
+_REMAINING = _SCANNER.mask("remain", "remian", "left")
+_LOST = _SCANNER.mask("lost")
+_BAT = _SCANNER.mask("bat")
+_WHO_IS = _SCANNER.mask("who", "is")
+_RUN = _SCANNER.mask("run")
+_NEEDED = _SCANNER.mask("need", "require")
+_WIN = _SCANNER.mask("win")
+_SCORE_TOTAL = _SCANNER.mask("score", "total")
+_OUT_DISMISS = _SCANNER.mask("out", "dismiss")
+_QUESTION_WORDS = _SCANNER.mask("how", "what", "who", "when")
+_OVER = _SCANNER.mask("over")
+_REMAIN_LEFT = _SCANNER.mask("remain", "left")
+_TARGET = _SCANNER.mask("target")
 
+
+@request_cached("stats")
 def _state_to_dict(state: MatchState) -> dict:
     """Convert MatchState to dictionary for LLM context."""
     dismissed_info = []
@@ -48,53 +74,52 @@ def _get_keyword_response(state: MatchState, query: str) -> str:
     
     This is the old keyword matching logic, kept as fallback.
     """
+    # Lowercase once; the keyword scan and the player lookup share it
     query_lower = query.lower() if query else ""
+    flags = _SCANNER.scan(query_lower) if query_lower else 0
     
-    # Calculate key metrics
-    overs_remaining = 90 - state.overs_played
-    wickets_remaining = 10 - state.wickets_lost
-    runs_needed = state.target - state.total_runs
+    # Key metrics (derived from state)
+    overs_remaining = state.overs_remaining
+    wickets_remaining = state.wickets_remaining
+    runs_needed = state.runs_needed
     overs_str = f"{state.overs_played:.1f}"
     
     # Answer specific questions
-    if "wicket" in query_lower and ("remain" in query_lower or "remian" in query_lower or "left" in query_lower):
+    if flags & _WICKET and flags & _REMAINING:
         return f"India has {wickets_remaining} wickets remaining (currently {state.wickets_lost} down)."
     
-    if "wicket" in query_lower and "lost" in query_lower:
+    if flags & _WICKET and flags & _LOST:
         return f"India has lost {state.wickets_lost} wickets so far."
     
-    if "bat" in query_lower and ("who" in query_lower or "is" in query_lower):
+    if flags & _BAT and flags & _WHO_IS:
         return f"Currently batting: {state.current_batter.name} ({state.current_batter.runs}* runs, {state.current_batter.balls_faced} balls)."
     
-    if "run" in query_lower and ("need" in query_lower or "require" in query_lower):
+    if flags & _RUN and flags & _NEEDED:
         return f"India needs {runs_needed} more runs to win (currently {state.total_runs}/{state.wickets_lost})."
     
-    if "run" in query_lower and "win" in query_lower:
+    if flags & _RUN and flags & _WIN:
         return f"India needs {runs_needed} more runs to win (currently {state.total_runs}/{state.wickets_lost})."
     
-    if "run" in query_lower and ("score" in query_lower or "total" in query_lower):
+    if flags & _RUN and flags & _SCORE_TOTAL:
         return f"India's current score: {state.total_runs} runs for {state.wickets_lost} wickets."
     
     # Questions about dismissed players
-    if any(name.lower() in query_lower for name in ["jaiswal", "jasiwal", "yashasvi"]):
-        for player in state.dismissed_players:
-            if "jaiswal" in player.name.lower() or "jasiwal" in query_lower:
-                dismissal_desc = f"c {player.fielder}" if player.fielder else player.dismissal_mode
-                return f"{player.name} scored {player.runs} runs. Dismissed: {dismissal_desc} b {player.bowler}."
+    player = find_dismissed_player(state, query_lower) if query_lower else None
+    if player is not None:
+        dismissal_desc = f"c {player.fielder}" if player.fielder else player.dismissal_mode
+        return f"{player.name} scored {player.runs} runs. Dismissed: {dismissal_desc} b {player.bowler}."
     
     # Generic dismissed player questions
-    if ("out" in query_lower or "dismiss" in query_lower) and any(
-        word in query_lower for word in ["how", "what", "who", "when"]
-    ):
+    if flags & _OUT_DISMISS and flags & _QUESTION_WORDS:
         if state.dismissed_players:
             last_dismissed = state.dismissed_players[-1]
             dismissal_desc = f"c {last_dismissed.fielder}" if last_dismissed.fielder else last_dismissed.dismissal_mode
             return f"{last_dismissed.name} scored {last_dismissed.runs} runs. Dismissed: {dismissal_desc} b {last_dismissed.bowler}."
     
-    if "over" in query_lower and ("remain" in query_lower or "left" in query_lower):
+    if flags & _OVER and flags & _REMAIN_LEFT:
         return f"Approximately {overs_remaining:.1f} overs remaining in the day (currently at {overs_str} overs)."
     
-    if "target" in query_lower:
+    if flags & _TARGET:
         return f"India's target is {state.target} runs. Currently at {state.total_runs}/{state.wickets_lost}."
     
     # Default: Full scorecard summary
@@ -133,7 +158,7 @@ async def get_stats_response_async(state: MatchState, query: str = "") -> str:
     state_data = _state_to_dict(state)
     
     try:
-        intelligent_response = await get_intelligent_response(query, state_data, agent_type="stats")
+        intelligent_response = await batcher.submit(query, state_data, agent_type="stats")
         
         if intelligent_response:
             return intelligent_response
@@ -158,6 +183,7 @@ def get_stats_response(state: MatchState, query: str = "") -> str:
         # Return keyword response as fallback
         return _get_keyword_response(state, query)
     except RuntimeError:
-        # No running loop, can use asyncio.run
-        return asyncio.run(get_stats_response_async(state, query))
+        # No running loop: run on the shared background loop (reused across calls,
+        # unlike asyncio.run which builds and tears down a loop every time)
+        return run_sync(get_stats_response_async(state, query))
 
@@ -6,14 +6,51 @@ Falls back to simple event description if OpenAI unavailable.
 """
 
 from src.core.state import MatchState
-from src.services.llm_client import get_intelligent_response
+from src.services.llm_batcher import batcher
+from src.agents._state_cache import request_cached
+from src.agents._players import find_dismissed_player
 
 
+# Last state converted by _state_to_dict, with its signature and dict.
+# Back-to-back queries usually see the same state, so one entry is enough.
+# Holding the state itself (not its id) keeps the identity check sound.
+_last_state = None
+_last_signature = None
+_last_dict = None
+
+
+def _state_signature(state: MatchState) -> tuple:
+    """Every field _build_state_dict reads that could change on the same object."""
+    return (
+        state.last_updated,
+        state.team_batting,
+        state.total_runs,
+        state.wickets_lost,
+        state.overs_played,
+        state.target,
+        state.current_batter,
+        state.dismissed_players,
+        len(state.recent_events),
+        state.recent_events[-1] if state.recent_events else None,
+    )
+
+
+@request_cached("tactical")
 def _state_to_dict(state: MatchState) -> dict:
+    """Convert MatchState to dictionary for LLM context, reusing the last dict if unchanged."""
+    global _last_state, _last_signature, _last_dict
+    signature = _state_signature(state)
+    if state is not _last_state or signature != _last_signature:
+        _last_dict = _build_state_dict(state)
+        _last_state, _last_signature = state, signature
+    return _last_dict
+
+
+def _build_state_dict(state: MatchState) -> dict:
     """Convert MatchState to dictionary for LLM context."""
     # Get recent events with details
     recent_events_detail = []
-    for event in state.recent_events[-3:]:  # Last 3 events
+    for event in state.tail_events(3):  # Last 3 events
         event_detail = {
             "type": event.event_type,
             "batter": event.batter,
@@ -59,11 +96,10 @@ def _get_fallback_response(state: MatchState, query: str = "") -> str:
     query_lower = query.lower() if query else ""
     
     # Check if asking about a specific dismissed player
-    if any(name.lower() in query_lower for name in ["jaiswal", "jasiwal", "yashasvi"]):
-        for player in state.dismissed_players:
-            if "jaiswal" in player.name.lower() or "jasiwal" in query_lower:
-                dismissal_desc = f"c {player.fielder}" if player.fielder else player.dismissal_mode
-                return f"{player.name} scored {player.runs} runs and was dismissed {dismissal_desc} b {player.bowler}."
+    player = find_dismissed_player(state, query_lower)
+    if player is not None:
+        dismissal_desc = f"c {player.fielder}" if player.fielder else player.dismissal_mode
+        return f"{player.name} scored {player.runs} runs and was dismissed {dismissal_desc} b {player.bowler}."
     
     # Check recent events
     if state.recent_events:
@@ -102,7 +138,7 @@ async def get_tactical_response_async(state: MatchState, query: str = "") -> str
     state_data = _state_to_dict(state)
     
     try:
-        intelligent_response = await get_intelligent_response(query, state_data, agent_type="tactical")
+        intelligent_response = await batcher.submit(query, state_data, agent_type="tactical")
         if intelligent_response:
             return intelligent_response
     except Exception:
@@ -12,16 +12,114 @@ Events are automatically fetched - no manual JSON input needed.
 """
 
 import asyncio
+import importlib
 import sys
 import os
+import threading
+from typing import Awaitable, Callable, Dict, Optional, Tuple
 
 from src.core.state import MatchState, initialize_match_state
-from src.agents.event_handler import update_state
+from src.agents.event_handler import update_state, update_state_batch
 from src.agents.router import route_query
-from src.core.probability import update_probability
-from src.services.cricket_api import poll_cricket_api
+from src.agents._state_cache import request_scope
+from src.core.probability import warm_up_probability_kernel
+from src.services.cricket_api import aclose_shared_clients, poll_cricket_api
 from src.services.historical_data import initialize_state_with_history
 
+# Query category -> (agent module, async response function, response prefix)
+_HANDLERS: Dict[str, Tuple[str, str, str]] = {
+    "stats": ("src.agents.stats_agent", "get_stats_response_async", "[STATS] "),
+    "probability": ("src.agents.probability_agent", "get_probability_response_async", "[PROBABILITY] "),
+    "momentum": ("src.agents.momentum_agent", "get_momentum_response_async", "[MOMENTUM] "),
+    "tactical": ("src.agents.tactical_agent", "get_tactical_response_async", "[TACTICAL] "),
+}
+
+# Handlers already imported, so each agent module is imported once
+_RESOLVED: Dict[str, Tuple[Callable[[MatchState, str], Awaitable[str]], str]] = {}
+
+
+def _resolve_handler(category: str) -> Optional[Tuple[Callable[[MatchState, str], Awaitable[str]], str]]:
+    """Import the agent for a category and return (handler, prefix), or None if unknown."""
+    spec = _HANDLERS.get(category)
+    if spec is None:
+        return None
+    module_name, func_name, prefix = spec
+    resolved = (getattr(importlib.import_module(module_name), func_name), prefix)
+    _RESOLVED[category] = resolved
+    return resolved
+
+
+# Bytes read from stdin past the last returned line
+_stdin_buffer = bytearray()
+
+
+def _read_line_blocking() -> str:
+    """
+    Read one line from stdin with os.read (blocking).
+    
+    Reads the raw file descriptor instead of using input(), which holds the
+    sys.stdin buffer lock while it waits. A daemon thread blocked there
+    would crash interpreter shutdown after Ctrl+C.
+    
+    Raises:
+        EOFError: If stdin is closed
+    """
+    while b"\n" not in _stdin_buffer:
+        chunk = os.read(sys.stdin.fileno(), 4096)
+        if not chunk:
+            if not _stdin_buffer:
+                raise EOFError
+            break
+        _stdin_buffer.extend(chunk)
+    
+    line, _, rest = bytes(_stdin_buffer).partition(b"\n")
+    _stdin_buffer[:] = rest
+    return line.decode(errors="replace")
+
+
+def _report_warmup_failure(task: asyncio.Task):
+    """Print why the probability kernel warm-up failed, instead of losing it until exit."""
+    if not task.cancelled() and task.exception() is not None:
+        print(f"⚠️  Probability kernel warm-up failed: {task.exception()}")
+
+
+def _resolve_future(future: asyncio.Future, line: str = None, exc: BaseException = None):
+    """Complete a pending input future unless its reader was cancelled."""
+    if future.done():
+        return
+    if exc is not None:
+        future.set_exception(exc)
+    else:
+        future.set_result(line)
+
+
+async def _read_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+    
+    The read runs on a daemon thread rather than the default executor, so a
+    read still waiting for the user never holds up shutdown after Ctrl+C.
+    
+    Raises:
+        EOFError: If stdin is closed
+    """
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    print(prompt, end="", flush=True)
+    
+    def read():
+        try:
+            line, exc = _read_line_blocking(), None
+        except Exception as e:
+            line, exc = None, e
+        try:
+            loop.call_soon_threadsafe(_resolve_future, future, line, exc)
+        except RuntimeError:
+            pass  # Loop already closed (agent exited while we were reading)
+    
+    threading.Thread(target=read, name="cricket-agent-input", daemon=True).start()
+    return await future
+
 
 class CricketAgent:
     """
@@ -54,6 +152,8 @@ class CricketAgent:
         self.auto_poll = auto_poll
         self.poll_interval = poll_interval
         self.fetch_history = fetch_history
+        # Background probability kernel warm-up (kept so it isn't garbage-collected)
+        self.warmup_task: Optional[asyncio.Task] = None
     
     def display_current_state(self):
         """Display current match state in CLI."""
@@ -79,61 +179,80 @@ class CricketAgent:
             str: Agent's response
         """
         try:
-            # Route query to appropriate category
-            category = route_query(query)
-            
-            # Handle based on category
-            if category == "stats":
-                from src.agents.stats_agent import get_stats_response_async
-                response = await get_stats_response_async(self.state, query)
-                return f"[STATS] {response}"
+            # One state-dict cache per query, shared by all agents it fans out to
+            with request_scope():
+                # Route query to appropriate category
+                category = route_query(query)
             
-            elif category == "probability":
-                from src.agents.probability_agent import get_probability_response_async
-                response = await get_probability_response_async(self.state, query)
-                return f"[PROBABILITY] {response}"
-            
-            elif category == "momentum":
-                from src.agents.momentum_agent import get_momentum_response_async
-                response = await get_momentum_response_async(self.state, query)
-                return f"[MOMENTUM] {response}"
-            
-            elif category == "tactical":
-                from src.agents.tactical_agent import get_tactical_response_async
-                response = await get_tactical_response_async(self.state, query)
-                return f"[TACTICAL] {response}"
-            
-            else:
-                return "I didn't understand that. Try: 'What's the score?', 'Can India draw?', 'What just happened?'"
+                # Dispatch to the agent for this category (one dict lookup once warm)
+                resolved = _RESOLVED.get(category) or _resolve_handler(category)
+                if resolved is None:
+                    return "I didn't understand that. Try: 'What's the score?', 'Can India draw?', 'What just happened?'"
+                
+                handler, prefix = resolved
+                return prefix + await handler(self.state, query)
         
         except Exception as e:
             return f"Error processing query: {str(e)}"
     
     
     async def process_auto_events(self):
-        """Process events from API polling queue."""
-        while self.running:
+        """
+        Process events from API polling queue.
+        
+        Blocks on the queue until an event arrives; run() cancels this
+        task on exit. Events that are already queued together (e.g. a
+        catch-up after a slow poll) are applied with one state rebuild and
+        reported with a single write to stdout.
+        """
+        # Bind hot-path lookups once instead of on every event
+        queue = self.event_queue
+        get, get_nowait, task_done = queue.get, queue.get_nowait, queue.task_done
+        write, flush = sys.stdout.write, sys.stdout.flush
+        
+        while True:
+            events = [await get()]
+            while not queue.empty():
+                events.append(get_nowait())
+            
+            # Start on a fresh line (the user may be sitting at the prompt)
+            messages = ["\r\n"]
             try:
-                # Check for events from API
-                if not self.event_queue.empty():
-                    event = await asyncio.wait_for(self.event_queue.get(), timeout=0.1)
-                    # Update state with event
-                    self.state = update_state(self.state, event)
-                    self.state.p_draw = update_probability(self.state.p_draw, event, self.state)
-                    self.state.p_sa_win = 1.0 - self.state.p_draw
-                    
-                    print(f"\n🔄 Auto-update: {event.event_type} - Score: {self.state.total_runs}/{self.state.wickets_lost}")
-                    print(f"   P(Draw): {self.state.p_draw:.0%}\n")
-                else:
-                    await asyncio.sleep(0.5)  # Small delay to avoid busy waiting
-            except asyncio.TimeoutError:
-                continue
-            except Exception as e:
-                print(f"⚠️  Error processing auto event: {e}")
-                await asyncio.sleep(1)
+                # update_state_batch also updates p_draw for every event
+                self.state = update_state_batch(self.state, events)
+                applied = events
+            except Exception:
+                # Apply one at a time so a bad event doesn't drop the rest
+                applied = []
+                for event in events:
+                    try:
+                        self.state = update_state(self.state, event)
+                        applied.append(event)
+                    except Exception as e:
+                        messages.append(f"⚠️  Error processing auto event: {e}\n")
+            
+            for event in applied:
+                messages.append(
+                    f"🔄 Auto-update: {event.event_type} - Score: {event.current_score}/{event.current_wickets}\n"
+                )
+            if applied:
+                messages.append(f"   P(Draw): {self.state.p_draw:.0%}\n\n")
+            
+            # Redraw the prompt after the batch
+            messages.append("> ")
+            write("".join(messages))
+            flush()
+            
+            for _ in events:
+                task_done()
     
     async def run(self):
         """Main async event loop."""
+        # Compile the probability kernel in the background while the state
+        # loads, so the JIT cost doesn't land on the first polled event
+        self.warmup_task = asyncio.create_task(asyncio.to_thread(warm_up_probability_kernel))
+        self.warmup_task.add_done_callback(_report_warmup_failure)
+        
         # Initialize state (with historical data if enabled)
         if self.fetch_history:
             print("🔄 Initializing state with historical data...")
@@ -159,8 +278,9 @@ class CricketAgent:
         
         while self.running:
             try:
-                # Get user input - queries only (no JSON events)
-                user_input = input("> ").strip()
+                # Get user input - queries only (no JSON events). Read on a
+                # thread so polling and auto-updates keep running meanwhile.
+                user_input = (await _read_input("> ")).strip()
                 
                 if not user_input:
                     continue
@@ -184,6 +304,15 @@ class CricketAgent:
                 print("\n\nGoodbye!\n")
                 self.running = False
                 break
+        
+        # Stop background polling and event processing
+        if self.auto_poll:
+            polling_task.cancel()
+            event_processor.cancel()
+            await asyncio.gather(polling_task, event_processor, return_exceptions=True)
+        
+        # Close the cricket APIs' pooled connections (also used by the history fetch)
+        await aclose_shared_clients()
 
 
 async def main():
@@ -7,15 +7,24 @@ This package contains:
 - State initialization utilities
 """
 
-from .state import Batter, Event, MatchState, DismissedPlayer, initialize_match_state
-from .probability import update_probability
+from .state import (
+    Batter,
+    Event,
+    MatchState,
+    DismissedPlayer,
+    MAX_RECENT_EVENTS,
+    initialize_match_state,
+)
+from .probability import update_probability, replay_probability
 
 __all__ = [
     "Batter",
     "Event",
     "MatchState",
     "DismissedPlayer",
+    "MAX_RECENT_EVENTS",
     "initialize_match_state",
     "update_probability",
+    "replay_probability",
 ]
 
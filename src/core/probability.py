@@ -13,10 +13,89 @@ The model accounts for:
 This is a simplified probabilistic model suitable for real-time updates.
 For production use, consider more sophisticated models based on historical
 data and advanced statistics.
+
+The arithmetic lives in a scalar kernel that is JIT-compiled with Numba
+when it is installed (compiled code is cached under __pycache__); without
+Numba the same kernel runs as plain Python.
 """
 
+from typing import Iterable
+
 from .state import Event, MatchState
 
+# Optional JIT compiler for the probability kernel
+try:
+    import numba
+    
+    _njit = numba.njit(cache=True, fastmath=True)
+except ImportError:
+    def _njit(func):
+        return func
+
+# Event type codes passed to the kernel
+EVENT_WICKET = 0
+EVENT_RUNS = 1
+EVENT_OTHER = 2
+
+_EVENT_CODES = {"wicket": EVENT_WICKET, "runs": EVENT_RUNS}
+
+# Per-event multipliers applied to p_draw
+_MULTIPLIERS = (
+    # Wicket penalty: India already weak at 2/3
+    # Early wickets hurt more (lose 15%), late wickets hurt even more (lose 30% - collapse risk)
+    0.85,  # Wicket with fewer than 5 down
+    0.70,  # Wicket with 5+ down (high collapse risk)
+    # Runs scored: Boundaries help India survive
+    1.05,  # Boundary (+5% boost)
+    1.0,   # Anything else
+)
+
+_kernel_warm = False
+
+
+@_njit
+def _update_probability_kernel(
+    old_p_draw: float,
+    event_type_code: int,
+    runs_scored: int,
+    wickets_lost: int,
+    overs_played: float
+) -> float:
+    """Scalar core of update_probability (see it for the model)."""
+    p_draw = old_p_draw
+    
+    # Time decay: More overs played = safer for batsmen to draw
+    # As time passes, India just needs to survive, not chase runs
+    overs_remaining = 90 - overs_played
+    time_factor = min(1.0, 1 + (overs_remaining / 90) * 0.2)  # Max +20% boost
+    p_draw *= time_factor
+    
+    # One table lookup replaces the wicket and boundary if-chains
+    if event_type_code == EVENT_WICKET:
+        multiplier = _MULTIPLIERS[0 if wickets_lost < 5 else 1]
+    else:
+        multiplier = _MULTIPLIERS[2 if event_type_code == EVENT_RUNS and runs_scored >= 4 else 3]
+    p_draw *= multiplier
+    
+    # Cap between 0.05 and 0.95
+    # Always leave some chance of collapse or counter-attack
+    return max(0.05, min(0.95, p_draw))
+
+
+def warm_up_probability_kernel():
+    """
+    Compile (or load from cache) the probability kernel ahead of time.
+    
+    The first call to a JIT-compiled function pays its compile/load cost;
+    calling this during start-up (CricketAgent.run does it on a worker
+    thread) keeps that off the first real event. Safe to call repeatedly,
+    and a no-op in practice without Numba.
+    """
+    global _kernel_warm
+    if not _kernel_warm:
+        _update_probability_kernel(0.35, EVENT_RUNS, 4, 2, 6.0)
+        _kernel_warm = True
+
 
 def update_probability(old_p_draw: float, event: Event, state: MatchState) -> float:
     """
@@ -46,29 +125,45 @@ def update_probability(old_p_draw: float, event: Event, state: MatchState) -> fl
         >>> new_prob = update_probability(0.35, event, state)
         >>> print(f"New draw probability: {new_prob:.2%}")
     """
-    p_draw = old_p_draw
-    
-    # Time decay: More overs played = safer for batsmen to draw
-    # As time passes, India just needs to survive, not chase runs
-    overs_remaining = 90 - state.overs_played
-    time_factor = min(1.0, 1 + (overs_remaining / 90) * 0.2)  # Max +20% boost
-    p_draw *= time_factor
+    return _update_probability_kernel(
+        float(old_p_draw),
+        _EVENT_CODES.get(event.event_type, EVENT_OTHER),
+        int(event.runs_scored),
+        int(state.wickets_lost),
+        float(state.overs_played),
+    )
+
+
+def replay_probability(
+    old_p_draw: float,
+    events: Iterable[Event],
+    wickets_lost: int,
+    overs_played: float
+) -> float:
+    """
+    Apply update_probability for a run of consecutive events in one pass.
     
-    # Wicket penalty: India already weak at 2/3
-    # Early wickets hurt more (lose 15%), late wickets hurt even more (lose 30% - collapse risk)
-    if event.event_type == 'wicket':
-        if state.wickets_lost < 5:
-            p_draw *= 0.85  # Lose 15% per wicket early in innings
-        else:
-            p_draw *= 0.70  # Lose 30% if already 5+ down (high collapse risk)
+    Equivalent to calling update_probability once per event with the state
+    each event was applied to, without building the intermediate states.
+    Each event's own score line becomes the "before" state for the next.
     
-    # Runs scored: Boundaries help India survive
-    # Scoring runs means India is building partnerships and surviving
-    if event.event_type == 'runs':
-        if event.runs_scored >= 4:
-            p_draw *= 1.05  # Boundary helps survival (+5% boost)
+    Args:
+        old_p_draw: Draw probability before the first event
+        events: Events in the order they occurred
+        wickets_lost: Wickets lost before the first event
+        overs_played: Overs played before the first event
     
-    # Cap between 0.05 and 0.95
-    # Always leave some chance of collapse or counter-attack
-    return max(0.05, min(0.95, p_draw))
-
+    Returns:
+        float: Draw probability after the last event
+    """
+    p_draw = float(old_p_draw)
+    for event in events:
+        p_draw = _update_probability_kernel(
+            p_draw,
+            _EVENT_CODES.get(event.event_type, EVENT_OTHER),
+            int(event.runs_scored),
+            int(wickets_lost),
+            float(overs_played),
+        )
+        wickets_lost, overs_played = event.current_wickets, event.overs_played
+    return p_draw
@@ -1,21 +1,50 @@
 """
 State models for cricket agent system.
 
-This module defines the core data structures using Pydantic:
+This module defines the core data structures as slotted dataclasses:
 - Batter: Represents a batsman's current state
 - Event: Represents a single cricket event (wicket, runs, etc.)
 - MatchState: Represents the complete match state at any point in time
 
-These models form the foundation of the system's state management,
-ensuring type safety and data validation throughout the application.
+These models form the foundation of the system's state management.
+A new MatchState (and usually a new Event) is created for every ball, so
+the models use __slots__ and skip per-construction validation; untrusted
+input is coerced and checked once at the boundary with Event.from_api.
 """
 
+import sys
+from collections import deque
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
-from pydantic import BaseModel, Field
+from itertools import islice
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
+# Number of recent events kept on MatchState (older events are dropped)
+MAX_RECENT_EVENTS = 32
 
-class Batter(BaseModel):
+# Number of most recent events summarized by the momentum counters
+MOMENTUM_WINDOW = 10
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    """Coerce an optional payload value to str, keeping None."""
+    return None if value is None else str(value)
+
+
+def _as_int(value: Any, name: str) -> int:
+    """Coerce a payload value to int, rejecting floats with a fractional part."""
+    if isinstance(value, float) and not value.is_integer():
+        raise ValueError(f"{name} must be a whole number, got {value}")
+    return int(value)
+
+
+def _optional_interned(value: Any) -> Optional[str]:
+    """Coerce an optional payload value to an interned str, keeping None."""
+    return None if value is None else sys.intern(str(value))
+
+
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Batter:
     """
     Represents a batsman's current state.
     
@@ -31,7 +60,8 @@ class Batter(BaseModel):
     is_on_strike: bool
 
 
-class Event(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class Event:
     """
     Represents a single cricket event (ball-by-ball or significant event).
     
@@ -41,7 +71,7 @@ class Event(BaseModel):
     
     Attributes:
         timestamp: When the event occurred
-        event_type: Type of event ('wicket', 'runs', 'maiden', 'boundary', etc.)
+        event_type: Type of event: 'wicket', 'runs', 'maiden', 'boundary', 'dot', 'wide', 'no_ball'
         runs_scored: Runs scored in this event (0 for wickets)
         batter: Name of the batsman involved
         bowler: Name of the bowler
@@ -51,29 +81,75 @@ class Event(BaseModel):
         current_score: Total runs after this ball
         current_wickets: Wickets lost after this ball
         balls_in_over: Which ball of the over (1-6)
-        commentary: Ball-by-ball description
+        commentary: Ball-by-ball description from Cricbuzz
     """
     timestamp: datetime
-    event_type: str = Field(
-        ...,
-        description="Type of event: 'wicket', 'runs', 'maiden', 'boundary', 'dot', 'wide', 'no_ball'"
-    )
+    event_type: str
     runs_scored: int = 0
     batter: Optional[str] = None
     bowler: Optional[str] = None
-    overs_played: float = Field(..., description="Overs played (e.g., 12.3 means 12 overs and 3 balls)")
-    dismissal_mode: Optional[str] = Field(
-        None,
-        description="For wickets: 'caught', 'bowled', 'lbw', 'stumped'"
-    )
-    fielder: Optional[str] = Field(None, description="Who caught/ran out the batter (for wickets)")
-    current_score: int = Field(..., description="Total runs after this ball")
-    current_wickets: int = Field(..., description="Wickets lost after this ball")
-    balls_in_over: int = Field(ge=1, le=6, description="Which ball of the over (1-6)")
-    commentary: Optional[str] = Field(None, description="Ball-by-ball description from Cricbuzz")
+    overs_played: float
+    dismissal_mode: Optional[str] = None
+    fielder: Optional[str] = None
+    current_score: int
+    current_wickets: int
+    balls_in_over: int
+    commentary: Optional[str] = None
+    
+    @classmethod
+    def from_api(cls, payload: Dict[str, Any]) -> "Event":
+        """
+        Build an Event from untrusted input (parsed JSON or an API payload).
+        
+        Numeric fields are coerced once here (integer fields reject values
+        with a fractional part rather than truncating them); the constructor
+        itself trusts its callers and does no validation. Unknown keys are
+        ignored.
+        event_type and dismissal_mode come from a small fixed vocabulary, so
+        they are interned: every event shares one string object per value
+        and the == checks downstream short-circuit on identity.
+        
+        Args:
+            payload: Event data with a datetime 'timestamp'
+        
+        Returns:
+            Event: Validated event
+        
+        Raises:
+            ValueError: If a field is missing, has the wrong type, or is out of range
+        """
+        try:
+            timestamp = payload["timestamp"]
+            if not isinstance(timestamp, datetime):
+                raise TypeError(f"timestamp must be a datetime, got {type(timestamp).__name__}")
+            
+            event = cls(
+                timestamp=timestamp,
+                event_type=sys.intern(str(payload["event_type"])),
+                runs_scored=_as_int(payload.get("runs_scored", 0), "runs_scored"),
+                batter=_optional_str(payload.get("batter")),
+                bowler=_optional_str(payload.get("bowler")),
+                overs_played=float(payload["overs_played"]),
+                dismissal_mode=_optional_interned(payload.get("dismissal_mode")),
+                fielder=_optional_str(payload.get("fielder")),
+                current_score=_as_int(payload["current_score"], "current_score"),
+                current_wickets=_as_int(payload["current_wickets"], "current_wickets"),
+                balls_in_over=_as_int(payload["balls_in_over"], "balls_in_over"),
+                commentary=_optional_str(payload.get("commentary")),
+            )
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e.args[0]}") from None
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid event field: {e}") from None
+        
+        if not 1 <= event.balls_in_over <= 6:
+            raise ValueError(f"balls_in_over must be between 1 and 6, got {event.balls_in_over}")
+        
+        return event
 
 
-class DismissedPlayer(BaseModel):
+@dataclass(slots=True, frozen=True, kw_only=True)
+class DismissedPlayer:
     """
     Represents a dismissed player with their score and dismissal details.
     
@@ -100,7 +176,8 @@ class DismissedPlayer(BaseModel):
     dismissed_at_overs: float  # Overs when dismissed
 
 
-class MatchState(BaseModel):
+@dataclass(slots=True, kw_only=True)
+class MatchState:
     """
     Represents the complete match state at any point in time.
     
@@ -119,10 +196,12 @@ class MatchState(BaseModel):
         overs_played: Overs played (e.g., 12.3)
         target: Target runs to win
         current_batter: Current batsman on strike
-        dismissed_players: List of dismissed players
-        recent_events: Recent match events (for context)
+        dismissed_players: Dismissed players, in order of dismissal
+        recent_events: Recent match events (bounded to the last MAX_RECENT_EVENTS)
+        per_batter_runs: Runs scored per batter from processed 'runs' events
+        recent_wickets_10: Wickets among the last MOMENTUM_WINDOW events (computed if omitted)
+        recent_runs_10: Runs from 'runs' events among the last MOMENTUM_WINDOW events (computed if omitted)
         p_draw: Probability of draw (0.0 to 1.0)
-        p_sa_win: Probability of SA win (0.0 to 1.0)
         last_updated: When state was last updated
     """
     match_id: str
@@ -132,11 +211,61 @@ class MatchState(BaseModel):
     overs_played: float
     target: int
     current_batter: Batter
-    dismissed_players: List[DismissedPlayer] = Field(default_factory=list)
-    recent_events: List[Event] = Field(default_factory=list)
-    p_draw: float = Field(..., ge=0.0, le=1.0, description="Probability of draw (0.0 to 1.0)")
-    p_sa_win: float = Field(..., ge=0.0, le=1.0, description="Probability of SA win (0.0 to 1.0)")
+    dismissed_players: Tuple[DismissedPlayer, ...] = ()
+    recent_events: Deque[Event] = field(default_factory=lambda: deque(maxlen=MAX_RECENT_EVENTS))
+    per_batter_runs: Dict[str, int] = field(default_factory=dict)
+    recent_wickets_10: Optional[int] = None
+    recent_runs_10: Optional[int] = None
+    p_draw: float
     last_updated: datetime
+    
+    def __post_init__(self):
+        # Keep recent_events bounded even when built from a plain list
+        if not isinstance(self.recent_events, deque) or self.recent_events.maxlen != MAX_RECENT_EVENTS:
+            self.recent_events = deque(self.recent_events, maxlen=MAX_RECENT_EVENTS)
+        if not isinstance(self.dismissed_players, tuple):
+            self.dismissed_players = tuple(self.dismissed_players)
+        
+        # Compute the momentum counters when a state is built without them
+        if self.recent_wickets_10 is None:
+            self.recent_wickets_10 = sum(
+                1 for e in self.tail_events(MOMENTUM_WINDOW) if e.event_type == "wicket"
+            )
+        if self.recent_runs_10 is None:
+            self.recent_runs_10 = sum(
+                e.runs_scored for e in self.tail_events(MOMENTUM_WINDOW) if e.event_type == "runs"
+            )
+    
+    @property
+    def p_sa_win(self) -> float:
+        """Probability of SA win (India can't realistically win, so 1 - p_draw)."""
+        return 1.0 - self.p_draw
+    
+    @property
+    def overs_remaining(self) -> float:
+        """Overs left in the day (90-over day)."""
+        return 90 - self.overs_played
+    
+    @property
+    def wickets_remaining(self) -> int:
+        """Wickets the batting side has left."""
+        return 10 - self.wickets_lost
+    
+    @property
+    def runs_needed(self) -> int:
+        """Runs still required to reach the target."""
+        return self.target - self.total_runs
+    
+    def tail_events(self, n: int) -> List[Event]:
+        """
+        Return the last n events, oldest first.
+        
+        Deques don't support slicing, so this walks back from the end
+        and only touches the n events it returns.
+        """
+        events = list(islice(reversed(self.recent_events), n))
+        events.reverse()
+        return events
 
 
 def initialize_match_state() -> MatchState:
@@ -169,10 +298,9 @@ def initialize_match_state() -> MatchState:
             balls_faced=4,
             is_on_strike=True
         ),
-        dismissed_players=[],  # Will be populated from events as they come in
-        recent_events=[],
+        dismissed_players=(),  # Will be populated from events as they come in
+        recent_events=deque(maxlen=MAX_RECENT_EVENTS),
         p_draw=0.35,  # Pre-Day-5 probability (India unlikely to win, more likely draw or lose)
-        p_sa_win=0.65,
         last_updated=datetime.now()
     )
 
@@ -4,19 +4,38 @@ Services layer for external integrations.
 This package contains:
 - Cricket API client for fetching live match data
 - LLM client for intelligent query responses
+- LLM batcher for coalescing concurrent agent requests
+- TTL cache for LLM responses (optionally persisted to disk)
 - Historical data fetcher
 """
 
-from .cricket_api import CricketAPIClient, poll_cricket_api
-from .llm_client import get_intelligent_response, get_openai_client, clear_cache
+from .cricket_api import CricketAPIClient, aclose_shared_clients, get_cricket_client, poll_cricket_api
+from .llm_client import (
+    get_intelligent_response,
+    get_intelligent_responses,
+    get_openai_client,
+    reset_openai_client,
+    cache_info,
+    clear_cache,
+)
+from .llm_batcher import LLMBatcher
+from .response_cache import PersistentTTLCache, TTLCache
 from .historical_data import initialize_state_with_history, fetch_and_update_historical_data
 
 __all__ = [
     "CricketAPIClient",
+    "aclose_shared_clients",
+    "get_cricket_client",
     "poll_cricket_api",
     "get_intelligent_response",
+    "get_intelligent_responses",
     "get_openai_client",
+    "reset_openai_client",
+    "cache_info",
     "clear_cache",
+    "LLMBatcher",
+    "TTLCache",
+    "PersistentTTLCache",
     "initialize_state_with_history",
     "fetch_and_update_historical_data",
 ]
@@ -0,0 +1,50 @@
+"""
+Shared background event loop for synchronous wrappers.
+
+Sync entry points (e.g. get_stats_response) used to call asyncio.run, which
+creates and tears down a loop on every call. Instead they submit their
+coroutine to one long-lived loop running on a daemon thread, so anything
+bound to the loop (batcher timers, client connection pools) stays warm
+between calls.
+"""
+
+import asyncio
+import threading
+from typing import Any, Coroutine, Optional, TypeVar
+
+T = TypeVar("T")
+
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_lock = threading.Lock()
+
+
+def get_background_loop() -> asyncio.AbstractEventLoop:
+    """
+    Return the shared background loop, starting it on first use.
+
+    Returns:
+        asyncio.AbstractEventLoop: Loop running forever on a daemon thread
+    """
+    global _loop
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(
+                target=_loop.run_forever, name="cricket-agent-loop", daemon=True
+            ).start()
+        return _loop
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine on the background loop and block until it finishes.
+
+    Must not be called from a thread that is already running an event loop.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        The coroutine's result (exceptions are re-raised)
+    """
+    return asyncio.run_coroutine_threadsafe(coro, get_background_loop()).result()
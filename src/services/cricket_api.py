@@ -12,16 +12,135 @@ Cost: $0.00 - All free APIs, no OpenAI calls for polling.
 
 This service layer abstracts away the details of fetching cricket data,
 allowing the system to work with multiple API sources seamlessly.
+Requests are made with an async HTTP client, so a slow API never blocks
+the event loop (user queries and event processing keep running).
 """
 
 import asyncio
+import functools
+import random
 import re
-import requests
-from typing import Optional, Dict, Any, List
+import time
+import weakref
+import httpx
+from typing import Optional, Dict, Any, Iterator, List
 from datetime import datetime
 
 from src.core.state import Event, MatchState, DismissedPlayer
 
+# Optional fast JSON parser, fed the raw response bytes (no str decode step)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Cricscore score string, e.g. "India: 27/2 (6.0 ov)" -> runs, wickets, overs
+_SCORE_RE = re.compile(r'(\d+)/(\d+)\s*\(([\d.]+)')
+
+# Seconds a resolved Cricscore match id is reused before re-reading the match list
+CRICSCORE_ID_TTL = 3600
+
+# Seconds an idle pooled connection is kept open; longer than the 30s poll
+# interval so each poll reuses the previous TCP/TLS connection (httpx default is 5s)
+KEEPALIVE_EXPIRY = 60.0
+
+# Polling cadence: back off exponentially (with jitter) while every source
+# fails, up to MAX_POLL_BACKOFF seconds; poll sooner right after a new event
+MAX_POLL_BACKOFF = 300
+ACTIVE_POLL_INTERVAL = 10
+
+# Sent with every request by the pooled client
+_DEFAULT_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+}
+
+
+# Pooled HTTP clients shared by every CricketAPIClient, one per event loop
+# (async connections belong to the loop that opened them)
+_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Number of CricketAPIClient instances using each shared pool; the last one
+# to call aclose() closes it
+_http_client_users: "weakref.WeakKeyDictionary[httpx.AsyncClient, int]" = weakref.WeakKeyDictionary()
+
+
+def _shared_http_client() -> httpx.AsyncClient:
+    """Get the running loop's pooled HTTP client, creating it on first use."""
+    loop = asyncio.get_running_loop()
+    client = _http_clients.get(loop)
+    if client is None or client.is_closed:
+        client = httpx.AsyncClient(
+            timeout=5.0,
+            follow_redirects=True,
+            headers=_DEFAULT_HEADERS,
+            limits=httpx.Limits(
+                max_connections=20,
+                max_keepalive_connections=20,
+                keepalive_expiry=KEEPALIVE_EXPIRY,
+            ),
+        )
+        _http_clients[loop] = client
+    return client
+
+
+def _release_shared_http_client(client: httpx.AsyncClient) -> bool:
+    """Drop one user of a shared pool; True when it was the last one."""
+    users = _http_client_users.pop(client, 0) - 1
+    if users > 0:
+        _http_client_users[client] = users
+        return False
+    return True
+
+
+async def aclose_shared_clients():
+    """
+    Close the running loop's shared HTTP pool, whoever is still using it.
+    
+    For process or loop shutdown; instances still holding the pool open a
+    new one on their next request.
+    """
+    client = _http_clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        _http_client_users.pop(client, None)
+        await client.aclose()
+
+
+def _player_to_dismissed(player: Dict[str, Any]) -> Optional[DismissedPlayer]:
+    """Build a DismissedPlayer from a Cricbuzz batting entry, or None if not out."""
+    get = player.get
+    if not (get("dismissed") or get("status") == "out"):
+        return None
+    return DismissedPlayer(
+        name=str(get("name", "Unknown")),
+        runs=int(get("runs", 0)),
+        balls_faced=int(get("balls", 0)),
+        dismissal_mode=str(get("dismissal_type", "unknown")),
+        bowler=str(get("bowler", "unknown")),
+        fielder=get("fielder"),
+        dismissed_at_score=int(get("score_at_dismissal", 0)),
+        dismissed_at_overs=float(get("overs_at_dismissal", 0.0))
+    )
+
+
+def _iter_batting_lineups(scorecard: Dict[str, Any]) -> Iterator[List[Dict[str, Any]]]:
+    """
+    Yield each batting list in a Cricbuzz scorecard.
+    
+    Covers both structures the API has been seen to return: a flat
+    scorecard["batting"] list, then scorecard["innings"][*]["batting"].
+    """
+    batting = scorecard.get("batting", [])
+    if isinstance(batting, list):
+        yield batting
+    innings = scorecard.get("innings", [])
+    if isinstance(innings, list):
+        for inning in innings:
+            batting_lineup = inning.get("batting", [])
+            if isinstance(batting_lineup, list):
+                yield batting_lineup
+
 
 class CricketAPIClient:
     """
@@ -32,26 +151,74 @@ class CricketAPIClient:
     provides event detection capabilities.
     
     Example:
-        >>> client = CricketAPIClient("117380", ("India", "South Africa"))
-        >>> match_data = await client.fetch_match_data()
-        >>> if match_data:
-        ...     event = client.detect_new_event(match_data, current_state)
+        >>> async with CricketAPIClient("117380", ("India", "South Africa")) as client:
+        ...     match_data = await client.fetch_match_data()
+        ...     if match_data:
+        ...         event = client.detect_new_event(match_data, current_state)
     """
     
-    def __init__(self, match_id: str = "117380", team_names: tuple = ("India", "South Africa")):
+    def __init__(
+        self,
+        match_id: str = "117380",
+        team_names: tuple = ("India", "South Africa"),
+        http_client: Optional[httpx.AsyncClient] = None
+    ):
         """
         Initialize cricket API client.
         
         Args:
             match_id: Match ID (for Cricbuzz)
             team_names: Tuple of (team1, team2) for Cricscore matching
+            http_client: Async HTTP client to use (the caller closes it); by
+                default all instances share one pooled client per event loop
         """
         self.match_id = match_id
         self.team_names = team_names
+        self._http = http_client
+        # Shared pool this instance holds a reference on, per event loop
+        self._shared: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+            weakref.WeakKeyDictionary()
+        )
         self.last_score = None
         self.last_wickets = None
         self.last_overs = None
         self.cricscore_match_id = None  # Will be set when we find the match
+        self._cricscore_id_expires = 0.0  # time.monotonic() deadline for reusing it
+    
+    def _http_client(self) -> httpx.AsyncClient:
+        """Get the HTTP client: the one passed in, or the loop's shared pool."""
+        if self._http is not None:
+            return self._http
+        loop = asyncio.get_running_loop()
+        client = _shared_http_client()
+        held = self._shared.get(loop)
+        if held is not client:
+            if held is not None:
+                _release_shared_http_client(held)  # Already closed and replaced
+            _http_client_users[client] = _http_client_users.get(client, 0) + 1
+            self._shared[loop] = client
+        return client
+    
+    async def aclose(self):
+        """
+        Release this instance's hold on the running loop's shared HTTP pool.
+        
+        The pool is closed once every instance using it has released it, so
+        a short-lived instance can't cut off the poller's requests. A client
+        passed to __init__ is left to its owner.
+        """
+        loop = asyncio.get_running_loop()
+        client = self._shared.pop(loop, None)
+        if client is not None and _release_shared_http_client(client):
+            if _http_clients.get(loop) is client:
+                del _http_clients[loop]
+            await client.aclose()
+    
+    async def __aenter__(self) -> "CricketAPIClient":
+        return self
+    
+    async def __aexit__(self, *exc_info):
+        await self.aclose()
     
     async def fetch_match_data(self) -> Optional[Dict[str, Any]]:
         """
@@ -82,74 +249,25 @@ class CricketAPIClient:
         API: https://cricscore-api.appspot.com/csa
         This is a simple, free API that provides live scores.
         
+        Once our match has been found in the match list, its id is reused
+        for CRICSCORE_ID_TTL seconds, so steady-state polls make a single
+        request. The list is looked up again when the id expires or the
+        score request for it fails.
+        
         Returns:
             Match data or None
         """
         try:
-            # Step 1: Get list of all live matches
-            matches_url = "https://cricscore-api.appspot.com/csa"
-            response = requests.get(matches_url, timeout=5)
-            
-            if response.status_code != 200:
-                return None
-            
-            matches = response.json()
-            if not matches:
-                return None
-            
-            # Step 2: Find our match by team names
-            match_id_to_use = None
-            for match in matches:
-                team1 = match.get("t1", "").lower()
-                team2 = match.get("t2", "").lower()
-                
-                # Check if either team name matches
-                if (any(team.lower() in team1 or team.lower() in team2 
-                       for team in self.team_names)):
-                    match_id_to_use = match.get("id")
-                    self.cricscore_match_id = match_id_to_use
-                    break
+            # Fast path: one request with the remembered match id
+            if self.cricscore_match_id and time.monotonic() < self._cricscore_id_expires:
+                data = await self._fetch_cricscore_score(self.cricscore_match_id)
+                if data:
+                    return data
+                self.cricscore_match_id = None  # Stale id, resolve it again
             
-            # If we found a match, get its score
+            match_id_to_use = await self._resolve_cricscore_match_id()
             if match_id_to_use:
-                score_url = f"https://cricscore-api.appspot.com/csa?id={match_id_to_use}"
-                score_response = requests.get(score_url, timeout=5)
-                
-                if score_response.status_code == 200:
-                    score_data = score_response.json()
-                    if score_data and len(score_data) > 0:
-                        match_info = score_data[0]
-                        
-                        # Parse the score string (format: "Team: 123/4 (12.3 ov)")
-                        score_str = match_info.get("si", "")
-                        status = match_info.get("status", "")
-                        
-                        # Extract runs, wickets, overs from score string
-                        # Format example: "India: 27/2 (6.0 ov)"
-                        runs = 0
-                        wickets = 0
-                        overs = 0.0
-                        
-                        # Try to parse score string
-                        score_match = re.search(r'(\d+)/(\d+)\s*\(([\d.]+)', score_str)
-                        if score_match:
-                            runs = int(score_match.group(1))
-                            wickets = int(score_match.group(2))
-                            overs = float(score_match.group(3))
-                        
-                        return {
-                            "score": {
-                                "runs": runs,
-                                "wickets": wickets
-                            },
-                            "overs": overs,
-                            "status": status,
-                            "score_string": score_str,
-                            "batsman": {"name": "Unknown"},  # Cricscore doesn't provide this
-                            "bowler": {"name": "Unknown"},
-                            "commentary": status,
-                            "balls_in_over": 1,
-                        }
+                return await self._fetch_cricscore_score(match_id_to_use)
             
         except Exception:
             # Silently fail - API might not be available
@@ -157,6 +275,94 @@ class CricketAPIClient:
         
         return None
     
+    async def _resolve_cricscore_match_id(self) -> Optional[Any]:
+        """
+        Find our match in Cricscore's list of live matches.
+        
+        Returns:
+            Cricscore match id (also remembered on the client) or None
+        """
+        # Get list of all live matches
+        matches_url = "https://cricscore-api.appspot.com/csa"
+        response = await self._http_client().get(matches_url)
+        
+        if response.status_code != 200:
+            return None
+        
+        # The list covers every live match worldwide, so decode it with the fastest parser available
+        matches = _json_loads(response.content)
+        if not matches:
+            return None
+        
+        # Lowercase our team names once, not once per listed match
+        team_names = [team.lower() for team in self.team_names]
+        
+        # Find our match by team names
+        for match in matches:
+            team1 = match.get("t1", "").lower()
+            team2 = match.get("t2", "").lower()
+            
+            # Check if either team name matches
+            if any(team in team1 or team in team2 for team in team_names):
+                self.cricscore_match_id = match.get("id")
+                self._cricscore_id_expires = time.monotonic() + CRICSCORE_ID_TTL
+                return self.cricscore_match_id
+        
+        return None
+    
+    async def _fetch_cricscore_score(self, match_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Fetch and parse the score for one Cricscore match.
+        
+        Args:
+            match_id: Cricscore match id
+        
+        Returns:
+            Match data or None if the request failed or returned nothing
+        """
+        score_url = f"https://cricscore-api.appspot.com/csa?id={match_id}"
+        score_response = await self._http_client().get(score_url)
+        
+        if score_response.status_code != 200:
+            return None
+        
+        score_data = _json_loads(score_response.content)
+        if not score_data:
+            return None
+        
+        match_info = score_data[0]
+        
+        # Parse the score string (format: "Team: 123/4 (12.3 ov)")
+        score_str = match_info.get("si", "")
+        status = match_info.get("status", "")
+        
+        # Extract runs, wickets, overs from score string
+        # Format example: "India: 27/2 (6.0 ov)"
+        runs = 0
+        wickets = 0
+        overs = 0.0
+        
+        # Try to parse score string
+        score_match = _SCORE_RE.search(score_str)
+        if score_match:
+            runs = int(score_match.group(1))
+            wickets = int(score_match.group(2))
+            overs = float(score_match.group(3))
+        
+        return {
+            "score": {
+                "runs": runs,
+                "wickets": wickets
+            },
+            "overs": overs,
+            "status": status,
+            "score_string": score_str,
+            "batsman": {"name": "Unknown"},  # Cricscore doesn't provide this
+            "bowler": {"name": "Unknown"},
+            "commentary": status,
+            "balls_in_over": 1,
+        }
+    
     async def _fetch_cricbuzz(self) -> Optional[Dict[str, Any]]:
         """
         Fetch from Cricbuzz - FREE, no API key needed!
@@ -170,9 +376,6 @@ class CricketAPIClient:
             # Cricbuzz match page - we'll parse the HTML or use their data endpoints
             # For now, try their API-like endpoints
             url = f"https://www.cricbuzz.com/match/{self.match_id}"
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            }
             
             # Note: This would require HTML parsing (BeautifulSoup) for full implementation
             # For now, return None and rely on Cricscore
@@ -198,23 +401,31 @@ class CricketAPIClient:
         Returns:
             Event if new event detected, None otherwise
         """
-        current_score = match_data.get("score", {}).get("runs", 0)
-        current_wickets = match_data.get("score", {}).get("wickets", 0)
+        return self._event_since(match_data, state.total_runs, state.wickets_lost, state.overs_played)
+    
+    def _event_since(
+        self,
+        match_data: Dict[str, Any],
+        previous_score: int,
+        previous_wickets: int,
+        previous_overs: float
+    ) -> Optional[Event]:
+        """Build the event that moved the score on from the given one, if any."""
+        score = match_data.get("score") or {}
+        current_score = score.get("runs", 0)
+        current_wickets = score.get("wickets", 0)
         current_overs = match_data.get("overs", 0.0)
         
-        # Check if anything changed
-        if (current_score == state.total_runs and 
-            current_wickets == state.wickets_lost and
-            abs(current_overs - state.overs_played) < 0.1):
+        # Check if anything changed (overs compared in whole balls/tenths, not as floats)
+        if (current_score, current_wickets, round(current_overs * 10)) == (
+            previous_score, previous_wickets, round(previous_overs * 10)
+        ):
             return None  # No change
         
         # Determine event type
-        if current_wickets > state.wickets_lost:
-            event_type = "wicket"
-            runs_scored = 0
-        else:
-            event_type = "runs"
-            runs_scored = current_score - state.total_runs
+        is_wicket = current_wickets > previous_wickets
+        event_type = "wicket" if is_wicket else "runs"
+        runs_scored = 0 if is_wicket else current_score - previous_score
         
         # Create event
         event = Event(
@@ -265,7 +476,8 @@ class CricketAPIClient:
         # Try Cricbuzz first (might have more detailed data)
         cricbuzz_data = await self._fetch_cricbuzz_detailed()
         if cricbuzz_data:
-            dismissed_players = self._parse_dismissals_from_cricbuzz(cricbuzz_data)
+            # Full-series scorecards are large; parse off the event loop so polling isn't held up
+            dismissed_players = await asyncio.to_thread(self._parse_dismissals_from_cricbuzz, cricbuzz_data)
             if dismissed_players:
                 return dismissed_players
         
@@ -288,12 +500,8 @@ class CricketAPIClient:
             # Try Cricbuzz scorecard endpoint
             # Format: https://www.cricbuzz.com/api/cricket-match/{match_id}
             url = f"https://www.cricbuzz.com/api/cricket-match/{self.match_id}"
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-                "Accept": "application/json"
-            }
-            
-            response = requests.get(url, headers=headers, timeout=5)
+            # User-Agent comes from the client's default headers
+            response = await self._http_client().get(url, headers={"Accept": "application/json"})
             if response.status_code == 200:
                 data = response.json()
                 # Check if we have scorecard data
@@ -317,56 +525,54 @@ class CricketAPIClient:
         Returns:
             List of DismissedPlayer objects
         """
-        dismissed_players = []
-        
         try:
-            # Try different possible structures in Cricbuzz API response
             scorecard = data.get("scorecard", {})
-            batting = scorecard.get("batting", [])
-            
-            # If batting is a list of players
-            if isinstance(batting, list):
-                for player in batting:
-                    if player.get("dismissed") or player.get("status") == "out":
-                        dismissed_players.append(
-                            DismissedPlayer(
-                                name=player.get("name", "Unknown"),
-                                runs=player.get("runs", 0),
-                                balls_faced=player.get("balls", 0),
-                                dismissal_mode=player.get("dismissal_type", "unknown"),
-                                bowler=player.get("bowler", "unknown"),
-                                fielder=player.get("fielder"),
-                                dismissed_at_score=player.get("score_at_dismissal", 0),
-                                dismissed_at_overs=player.get("overs_at_dismissal", 0.0)
-                            )
-                        )
-            
-            # Alternative structure: scorecard might have innings data
-            innings = scorecard.get("innings", [])
-            if isinstance(innings, list) and innings:
-                for inning in innings:
-                    batting_lineup = inning.get("batting", [])
-                    if isinstance(batting_lineup, list):
-                        for player in batting_lineup:
-                            if player.get("dismissed") or player.get("status") == "out":
-                                dismissed_players.append(
-                                    DismissedPlayer(
-                                        name=player.get("name", "Unknown"),
-                                        runs=player.get("runs", 0),
-                                        balls_faced=player.get("balls", 0),
-                                        dismissal_mode=player.get("dismissal_type", "unknown"),
-                                        bowler=player.get("bowler", "unknown"),
-                                        fielder=player.get("fielder"),
-                                        dismissed_at_score=player.get("score_at_dismissal", 0),
-                                        dismissed_at_overs=player.get("overs_at_dismissal", 0.0)
-                                    )
-                                )
-        
+            return [
+                dismissed
+                for dismissed in (
+                    _player_to_dismissed(player)
+                    for batting in _iter_batting_lineups(scorecard)
+                    for player in batting
+                )
+                if dismissed is not None
+            ]
         except Exception:
             # Graceful fallback - return empty list if parsing fails
-            pass
-        
-        return dismissed_players
+            return []
+
+
+@functools.lru_cache(maxsize=None)
+def get_cricket_client(
+    match_id: str = "117380",
+    team_names: tuple = ("India", "South Africa")
+) -> CricketAPIClient:
+    """
+    Get the shared CricketAPIClient for a match.
+    
+    The historical fetch and the poller use the same instance, so they
+    share the resolved Cricscore match id (every instance already shares
+    the loop's connection pool). Closing it (the poller does on exit) only
+    drops the pool; the next request opens a new one.
+    
+    Args:
+        match_id: Match ID (for Cricbuzz)
+        team_names: Tuple of (team1, team2) for Cricscore matching
+    
+    Returns:
+        CricketAPIClient: Same instance for the same arguments
+    """
+    return CricketAPIClient(match_id, team_names)
+
+
+def _backoff_delay(poll_interval: float, failures: int) -> float:
+    """
+    Seconds to wait after `failures` consecutive failed polls.
+    
+    Starts at poll_interval and doubles per further failure, capped at
+    MAX_POLL_BACKOFF, plus up to one poll_interval of random jitter so
+    clients don't all retry together when the API recovers.
+    """
+    return min(poll_interval * 2 ** (failures - 1), MAX_POLL_BACKOFF) + random.uniform(0, poll_interval)
 
 
 async def poll_cricket_api(
@@ -382,18 +588,22 @@ async def poll_cricket_api(
     Cost: $0.00 - Completely free.
     
     This function runs indefinitely, polling the API at regular intervals
-    and putting new events into the provided queue.
+    and putting new events into the provided queue. While no source answers
+    it backs off exponentially; right after a new event it polls again
+    within ACTIVE_POLL_INTERVAL seconds.
     
     Args:
         match_id: Match ID to track
-        state: Current match state (will be updated)
+        state: Match state when polling starts; later changes are detected
+            against the last score this poller queued, so each ball is queued once
         event_queue: Queue to put new events in
-        poll_interval: Seconds between polls (default: 30)
+        poll_interval: Seconds between polls when nothing fails (default: 30)
     """
     # Extract team names from state for Cricscore matching
     team_names = ("India", "South Africa")  # Default for this match
     
-    client = CricketAPIClient(match_id, team_names)
+    # Shared with the historical fetch, which may already have warmed it up
+    client = get_cricket_client(match_id, team_names)
     
     print(f"🔄 Starting FREE automated event polling (every {poll_interval} seconds)...")
     print("   ✅ Using Cricscore API (free, no API key needed)")
@@ -401,26 +611,44 @@ async def poll_cricket_api(
     print("   ✅ Cost: $0.00\n")
     
     poll_count = 0
+    failures = 0  # Consecutive polls where no source returned data
     
-    while True:
-        try:
-            poll_count += 1
-            
-            # Fetch latest event (FREE API call, no OpenAI)
-            event = await client.get_latest_event(state)
-            
-            if event:
-                # Put event in queue
-                await event_queue.put(event)
-                print(f"✅ New event detected: {event.event_type} - Score: {event.current_score}/{event.current_wickets}")
-            
-            # Wait before next poll
-            await asyncio.sleep(poll_interval)
-            
-        except Exception as e:
-            # Silently handle errors (APIs might not be available)
-            # Only print error every 10 polls to avoid spam
-            if poll_count % 10 == 0:
-                print(f"⚠️  API polling error (will retry): {e}")
-            await asyncio.sleep(poll_interval)
-
+    # Score as of the last queued event. `state` isn't updated while we poll,
+    # and the client is shared, so the baseline is tracked here.
+    last_seen = (state.total_runs, state.wickets_lost, state.overs_played)
+    
+    # Cancelling the polling task closes the HTTP client's connections
+    try:
+        while True:
+            try:
+                poll_count += 1
+                
+                # Fetch latest data (FREE API call, no OpenAI)
+                match_data = await client.fetch_match_data()
+                if not match_data:
+                    # Every source failed - back off instead of retrying at full rate
+                    failures += 1
+                    await asyncio.sleep(_backoff_delay(poll_interval, failures))
+                    continue
+                failures = 0
+                
+                event = client._event_since(match_data, *last_seen)
+                if event:
+                    last_seen = (event.current_score, event.current_wickets, event.overs_played)
+                    # Put event in queue
+                    await event_queue.put(event)
+                    print(f"✅ New event detected: {event.event_type} - Score: {event.current_score}/{event.current_wickets}")
+                    # Play is live, so the next change is likely soon
+                    await asyncio.sleep(min(poll_interval, ACTIVE_POLL_INTERVAL))
+                else:
+                    await asyncio.sleep(poll_interval)
+                
+            except Exception as e:
+                # Silently handle errors (APIs might not be available)
+                # Only print error every 10 polls to avoid spam
+                if poll_count % 10 == 0:
+                    print(f"⚠️  API polling error (will retry): {e}")
+                failures += 1
+                await asyncio.sleep(_backoff_delay(poll_interval, failures))
+    finally:
+        await client.aclose()
@@ -7,7 +7,7 @@ This allows the system to know about players dismissed before it started trackin
 
 from typing import List
 from src.core.state import MatchState, DismissedPlayer
-from .cricket_api import CricketAPIClient
+from .cricket_api import get_cricket_client
 
 
 async def fetch_and_update_historical_data(state: MatchState) -> MatchState:
@@ -25,18 +25,17 @@ async def fetch_and_update_historical_data(state: MatchState) -> MatchState:
     Returns:
         MatchState: Updated state with historical data
     """
-    client = CricketAPIClient(state.match_id, ("India", "South Africa"))
-    
     print("📊 Fetching historical dismissal data from API...")
     
     try:
-        # Fetch historical dismissals
+        # Fetch historical dismissals (shared client, left open for the poller)
+        client = get_cricket_client(state.match_id, ("India", "South Africa"))
         dismissed_players = await client.fetch_historical_dismissals()
         
         if dismissed_players:
             print(f"✅ Found {len(dismissed_players)} historical dismissals")
             # Update state with historical data
-            state.dismissed_players = dismissed_players
+            state.dismissed_players = tuple(dismissed_players)
         else:
             print("ℹ️  No historical dismissal data available from API")
             print("   (This is normal - system will track dismissals going forward)")
@@ -0,0 +1,145 @@
+"""
+Micro-batcher for LLM requests.
+
+Agents submit their queries here instead of calling the LLM client
+directly. Requests that arrive within a short window (or until the batch
+is full) are flushed together through get_intelligent_responses, so
+concurrent agent queries cost roughly one round trip instead of one each.
+"""
+
+import asyncio
+import weakref
+from typing import Optional, Dict, Any, List, Tuple
+
+from .llm_client import get_intelligent_responses
+
+
+class LLMBatcher:
+    """
+    Coalesces concurrent LLM requests into batches.
+
+    A batch is flushed when it reaches max_batch requests or when
+    max_wait_ms has elapsed since the first request in it arrived.
+    An instance belongs to the event loop of its first submit() and
+    rejects calls from any other loop.
+
+    Example:
+        >>> batcher = LLMBatcher(max_batch=16, max_wait_ms=10)
+        >>> answer = await batcher.submit("What's the score?", state_data, agent_type="stats")
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: int = 10):
+        """
+        Initialize the batcher.
+
+        Args:
+            max_batch: Maximum number of requests per batch
+            max_wait_ms: Maximum time to wait for a batch to fill (milliseconds)
+        """
+        self.max_batch = max_batch
+        self.max_wait = max_wait_ms / 1000
+        self._pending: List[Tuple[str, Dict[str, Any], str, asyncio.Future]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Batches in flight; the loop only holds weak references to tasks
+        self._tasks: "set[asyncio.Task]" = set()
+
+    async def submit(
+        self,
+        query: str,
+        state_data: Dict[str, Any],
+        agent_type: str = "stats"
+    ) -> Optional[str]:
+        """
+        Queue a request and wait for its batch to be answered.
+
+        Args:
+            query: User's query
+            state_data: Current match state data
+            agent_type: Type of agent ("stats", "momentum", "probability", "tactical")
+
+        Returns:
+            str: Intelligent response, or None if OpenAI unavailable
+        
+        Raises:
+            RuntimeError: If called from a different event loop than earlier calls
+        """
+        loop = asyncio.get_running_loop()
+        if self._loop is None:
+            self._loop = loop
+        elif self._loop is not loop:
+            raise RuntimeError("LLMBatcher is bound to a different event loop")
+        future = loop.create_future()
+        self._pending.append((query, state_data, agent_type, future))
+
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Hand the pending requests to a background task."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = batch[0][3].get_loop().create_task(self._run_batch(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: List[Tuple[str, Dict[str, Any], str, asyncio.Future]]):
+        """Execute one batch and resolve the waiting futures."""
+        try:
+            results = await get_intelligent_responses(
+                [(query, state_data, agent_type) for query, state_data, agent_type, _ in batch]
+            )
+        except Exception as e:
+            for *_, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (*_, future), result in zip(batch, results):
+            if not future.done():
+                future.set_result(result)
+
+
+class _PerLoopBatcher:
+    """
+    Routes submit() to one LLMBatcher per event loop.
+
+    The CLI loop and the background loop behind the sync wrappers each get
+    their own pending list and flush timer, so futures are always resolved
+    on the loop that created them.
+    """
+
+    def __init__(self, max_batch: int = 16, max_wait_ms: int = 10):
+        self.max_batch = max_batch
+        self.max_wait_ms = max_wait_ms
+        self._batchers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, LLMBatcher]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def for_loop(self, loop: asyncio.AbstractEventLoop) -> LLMBatcher:
+        """Get the batcher for a loop, creating it on first use."""
+        batcher = self._batchers.get(loop)
+        if batcher is None:
+            batcher = self._batchers[loop] = LLMBatcher(self.max_batch, self.max_wait_ms)
+        return batcher
+
+    async def submit(
+        self,
+        query: str,
+        state_data: Dict[str, Any],
+        agent_type: str = "stats"
+    ) -> Optional[str]:
+        """Queue a request on the running loop's batcher (see LLMBatcher.submit)."""
+        return await self.for_loop(asyncio.get_running_loop()).submit(query, state_data, agent_type)
+
+
+# Shared batcher used by all agents (one LLMBatcher per event loop underneath)
+batcher = _PerLoopBatcher(max_batch=16, max_wait_ms=10)
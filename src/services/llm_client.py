@@ -9,174 +9,487 @@ interface for getting intelligent responses with automatic caching.
 """
 
 import os
-import json
+import asyncio
 import hashlib
-from typing import Optional, Dict, Any
-from openai import OpenAI
+import logging
+import weakref
+from collections import OrderedDict
+from typing import Optional, Dict, Any, List, Tuple
+import httpx
+import openai
+from openai import AsyncOpenAI
 from dotenv import load_dotenv
 
+from .response_cache import CacheInfo, PersistentTTLCache, TTLCache
+
+# Optional fast JSON encoder for state fingerprints and prompt context
+try:
+    import orjson
+
+    def _dumps_sorted(data: Dict[str, Any]) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+
+    def _dumps_text(data: Any) -> str:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str).decode()
+except ImportError:
+    import json
+
+    def _dumps_sorted(data: Dict[str, Any]) -> bytes:
+        return json.dumps(data, sort_keys=True, default=str).encode()
+
+    def _dumps_text(data: Any) -> str:
+        return json.dumps(data, default=str, ensure_ascii=False, separators=(",", ":"))
+
 # Load environment variables
 load_dotenv()
 
-# Response cache to avoid redundant API calls
-_response_cache: Dict[str, str] = {}
+logger = logging.getLogger(__name__)
+
+# Models tried in order. A transient failure (rate limit, connection error,
+# 5xx) gets one quick retry on the next model, which has its own rate limit;
+# after that the agents fall back to keyword answers.
+_COMPLETION_MODELS = ("gpt-4o-mini", "gpt-3.5-turbo")
+_RETRY_DELAY = 0.2  # seconds before the retry
+_TRANSIENT_ERRORS = (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
+
+# (agent_type, normalized query, state fingerprint)
+CacheKey = Tuple[str, str, bytes]
+
+# Response cache to avoid redundant API calls. Entries expire after 30s,
+# about the time between balls, so answers don't outlive the state they describe.
+# Set LLM_CACHE_PATH to keep unexpired answers across restarts.
+_cache_path = os.getenv("LLM_CACHE_PATH")
+_response_cache = (
+    PersistentTTLCache(_cache_path, maxsize=1024, ttl=30)
+    if _cache_path else TTLCache(maxsize=1024, ttl=30)
+)
+
+# Requests currently waiting on OpenAI, per event loop and keyed by cache key.
+# Concurrent identical requests await the first caller's future; futures
+# belong to their loop, so callers on another loop (e.g. the sync wrappers'
+# background loop) make their own request. The cache itself holds plain
+# strings and is shared by every loop.
+_inflight: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[CacheKey, asyncio.Future]]" = (
+    weakref.WeakKeyDictionary()
+)
 
+# Recent state fingerprints, keyed by id(state_data). Each entry holds the
+# dict itself so its id can't be reused while the entry is alive.
+_FINGERPRINT_CACHE_SIZE = 16
+_fingerprints: "OrderedDict[int, Tuple[Dict[str, Any], bytes]]" = OrderedDict()
 
-def get_openai_client() -> Optional[OpenAI]:
+# Async OpenAI clients, one per event loop. Pooled async connections belong
+# to the loop that opened them, and the CLI's loop and the background loop
+# used by the sync wrappers are different loops.
+_openai_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Client handed out when no event loop is running (shared by such callers)
+_unbound_client: Optional[AsyncOpenAI] = None
+
+# Close tasks scheduled by reset_openai_client, kept alive until they finish
+_closing: "set[asyncio.Task]" = set()
+
+
+def get_openai_client() -> Optional[AsyncOpenAI]:
     """
-    Get OpenAI client if API key is available.
+    Get the async OpenAI client for the running event loop, if an API key is available.
+    
+    The client, and its HTTP connection pool, is created once per loop and
+    reused, so TLS connections to the API stay warm between queries.
     
     Returns:
-        OpenAI client or None if API key not found
+        AsyncOpenAI client or None if API key not found
     """
     api_key = os.getenv("OPENAI_API_KEY")
     if not api_key:
         return None
-    return OpenAI(api_key=api_key)
+    
+    global _unbound_client
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None  # Called outside a coroutine
+    
+    client = _openai_clients.get(loop) if loop is not None else _unbound_client
+    if client is None:
+        client = AsyncOpenAI(
+            api_key=api_key,
+            max_retries=0,  # _create_completion does its own quick retry/failover
+            http_client=httpx.AsyncClient(
+                timeout=30.0,
+                limits=httpx.Limits(max_keepalive_connections=32, max_connections=64),
+            ),
+        )
+        if loop is not None:
+            _openai_clients[loop] = client
+        else:
+            _unbound_client = client
+    return client
+
 
+def _close_client(client: AsyncOpenAI, loop: Optional[asyncio.AbstractEventLoop]) -> None:
+    """Close a dropped client, on the loop that owns its connections when possible."""
+    try:
+        running = asyncio.get_running_loop()
+    except RuntimeError:
+        running = None
+    
+    if loop is not None and loop.is_running() and loop is not running:
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+        return
+    if running is not None:
+        task = running.create_task(client.close())
+        _closing.add(task)
+        task.add_done_callback(_closing.discard)
+        return
+    try:
+        if loop is not None and not loop.is_closed():
+            loop.run_until_complete(client.close())
+        else:
+            asyncio.run(client.close())
+    except Exception as e:  # Connections tied to a closed loop can't be shut down cleanly
+        logger.debug("Failed to close OpenAI client: %s", e)
 
-def _get_cache_key(query: str, state_data: Dict[str, Any]) -> str:
+
+def reset_openai_client():
     """
-    Generate cache key from query and state.
+    Close and forget the cached OpenAI clients so the next call builds a fresh one.
     
-    Args:
-        query: User query
-        state_data: Match state data
+    Use after changing OPENAI_API_KEY (e.g. in tests); cached clients keep
+    the key they were created with. A client bound to the running loop is
+    closed in a background task.
+    """
+    global _unbound_client
+    dropped = list(_openai_clients.items())
+    if _unbound_client is not None:
+        dropped.append((None, _unbound_client))
+    _openai_clients.clear()
+    _unbound_client = None
     
-    Returns:
-        str: Cache key
-    """
-    # Create hash from query + key state fields
-    cache_data = {
-        "query": query.lower().strip(),
-        "runs": state_data.get("total_runs"),
-        "wickets": state_data.get("wickets_lost"),
-        "overs": round(state_data.get("overs_played", 0), 1),  # Round to avoid float precision issues
-    }
-    cache_str = json.dumps(cache_data, sort_keys=True)
-    return hashlib.md5(cache_str.encode()).hexdigest()
+    for loop, client in dropped:
+        _close_client(client, loop)
 
 
-async def get_intelligent_response(
-    query: str,
-    state_data: Dict[str, Any],
-    agent_type: str = "stats"
-) -> Optional[str]:
+def _state_fingerprint(state_data: Dict[str, Any]) -> bytes:
     """
-    Get intelligent response from OpenAI for a query.
+    Fingerprint a state dict (blake2b over sorted-key JSON).
     
-    Uses caching to avoid redundant API calls for identical queries/states.
+    Agents build one dict per state and share it across queries, so the
+    serialized fingerprint is remembered per dict object rather than
+    re-encoding the same state for every request. State dicts must not be
+    mutated after they are handed to the client.
+    """
+    entry = _fingerprints.get(id(state_data))
+    if entry is not None and entry[0] is state_data:
+        return entry[1]
+    
+    fingerprint = hashlib.blake2b(_dumps_sorted(state_data), digest_size=16).digest()
+    _fingerprints[id(state_data)] = (state_data, fingerprint)
+    if len(_fingerprints) > _FINGERPRINT_CACHE_SIZE:
+        _fingerprints.popitem(last=False)
+    return fingerprint
+
+
+def _get_cache_key(query: str, state_data: Dict[str, Any], agent_type: str) -> CacheKey:
+    """
+    Generate cache key from agent type, query and state.
+    
+    The state is fingerprinted in full, so any change an agent would show
+    the LLM also changes the key.
     
     Args:
-        query: User's query
-        state_data: Current match state data
-        agent_type: Type of agent ("stats", "momentum", "probability", "tactical")
+        query: User query
+        state_data: Match state data
+        agent_type: Type of agent
     
     Returns:
-        str: Intelligent response, or None if OpenAI unavailable
+        CacheKey: (agent_type, normalized query, 16-byte state fingerprint)
     """
-    client = get_openai_client()
-    if not client:
-        return None
-    
-    # Check cache first
-    cache_key = _get_cache_key(query, state_data)
-    if cache_key in _response_cache:
-        return _response_cache[cache_key]
-    
-    # Build context for the LLM based on agent type
-    base_context = f"""
+    return (agent_type, query.lower().strip(), _state_fingerprint(state_data))
+
+
+# Prompt templates, assembled once per agent type: the shared match-state
+# header followed by the agent-specific lines. Filled with str.format_map.
+_BASE_CONTEXT = """
 You are a cricket commentary agent answering questions about a live Test match.
 
 Current Match State:
-- Team: {state_data.get('team_batting', 'India')}
-- Score: {state_data.get('total_runs', 0)}/{state_data.get('wickets_lost', 0)}
-- Overs played: {state_data.get('overs_played', 0):.1f}
-- Target: {state_data.get('target', 0)} runs
+- Team: {team_batting}
+- Score: {total_runs}/{wickets_lost}
+- Overs played: {overs_played:.1f}
+- Target: {target} runs
 """
-    
-    # Add agent-specific context
-    if agent_type == "stats":
-        context = base_context + f"""
-- Current batsman: {state_data.get('current_batter', {}).get('name', 'Unknown')} ({state_data.get('current_batter', {}).get('runs', 0)}* runs)
-- Wickets remaining: {10 - state_data.get('wickets_lost', 0)}
-- Runs needed: {state_data.get('target', 0) - state_data.get('total_runs', 0)}
+
+_CONTEXT_TEMPLATES: Dict[str, str] = {
+    "stats": _BASE_CONTEXT + """
+- Current batsman: {batter_name} ({batter_runs}* runs)
+- Wickets remaining: {wickets_in_hand}
+- Runs needed: {runs_to_target}
 
 User Question: {query}
 
 Provide a concise, accurate answer about match statistics. Be specific with numbers.
-"""
-    
-    elif agent_type == "probability":
-        context = base_context + f"""
-- Overs remaining: {state_data.get('overs_remaining', 0):.1f}
-- Wickets remaining: {state_data.get('wickets_remaining', 0)}
-- Runs needed: {state_data.get('runs_needed', 0)}
-- P(Draw): {state_data.get('p_draw', 0):.0%}
-- P(SA Win): {state_data.get('p_sa_win', 0):.0%}
+""",
+    "probability": _BASE_CONTEXT + """
+- Overs remaining: {overs_remaining:.1f}
+- Wickets remaining: {wickets_remaining}
+- Runs needed: {runs_needed}
+- P(Draw): {p_draw:.0%}
+- P(SA Win): {p_sa_win:.0%}
 
 User Question: {query}
 
 Analyze the probability of different match outcomes. Consider the match situation, required run rate, wickets remaining, and time left.
-"""
-    
-    elif agent_type == "momentum":
-        recent_events = state_data.get('recent_events', [])
-        context = base_context + f"""
-- Recent events: {', '.join(recent_events) if recent_events else 'None'}
-- P(Draw): {state_data.get('p_draw', 0):.0%}
-- P(SA Win): {state_data.get('p_sa_win', 0):.0%}
+""",
+    "momentum": _BASE_CONTEXT + """
+- Recent events: {recent_events}
+- P(Draw): {p_draw:.0%}
+- P(SA Win): {p_sa_win:.0%}
 
 User Question: {query}
 
 Analyze the current momentum in the match. Consider recent events, scoring rate, wickets, and which team has the upper hand.
-"""
-    
-    elif agent_type == "tactical":
-        recent_events = state_data.get('recent_events', [])
-        context = base_context + f"""
-- Current batsman: {state_data.get('current_batter', {}).get('name', 'Unknown')} ({state_data.get('current_batter', {}).get('runs', 0)}* runs)
+""",
+    "tactical": _BASE_CONTEXT + """
+- Current batsman: {batter_name} ({batter_runs}* runs)
 - Recent events: {recent_events}
 
 User Question: {query}
 
 Provide tactical analysis of dismissals, bowling strategies, batting approaches, and match situation.
-"""
-    
-    else:
-        context = base_context + f"""
+""",
+}
+
+_DEFAULT_CONTEXT_TEMPLATE = _BASE_CONTEXT + """
 User Question: {query}
 
 Provide a concise, accurate answer based on the match state. Be specific and helpful.
 Answer naturally, as if you're a cricket commentator.
 """
+
+
+def _build_context(query: str, state_data: Dict[str, Any], agent_type: str) -> str:
+    """
+    Build the LLM prompt for a query based on agent type.
     
-    try:
-        # Call OpenAI API
-        response = client.chat.completions.create(
-            model="gpt-4o-mini",  # Cost-effective model
-            messages=[
-                {"role": "system", "content": "You are a helpful cricket commentary assistant. Answer questions accurately and concisely."},
-                {"role": "user", "content": context}
-            ],
-            max_tokens=150,
-            temperature=0.3,  # Lower temperature for more factual responses
-        )
+    Args:
+        query: User's query
+        state_data: Current match state data
+        agent_type: Type of agent ("stats", "momentum", "probability", "tactical")
+    
+    Returns:
+        str: Prompt text sent as the user message
+    """
+    get = state_data.get
+    total_runs = get('total_runs', 0)
+    wickets_lost = get('wickets_lost', 0)
+    target = get('target', 0)
+    fields = {
+        'query': query,
+        'team_batting': get('team_batting', 'India'),
+        'total_runs': total_runs,
+        'wickets_lost': wickets_lost,
+        'overs_played': get('overs_played', 0),
+        'target': target,
+    }
+    
+    # Only compute the fields this agent's template uses
+    if agent_type == "stats" or agent_type == "tactical":
+        current_batter = get('current_batter') or {}
+        fields['batter_name'] = current_batter.get('name', 'Unknown')
+        fields['batter_runs'] = current_batter.get('runs', 0)
+    if agent_type == "stats":
+        fields['wickets_in_hand'] = 10 - wickets_lost
+        fields['runs_to_target'] = target - total_runs
+    elif agent_type == "probability":
+        fields['overs_remaining'] = get('overs_remaining', 0)
+        fields['wickets_remaining'] = get('wickets_remaining', 0)
+        fields['runs_needed'] = get('runs_needed', 0)
+    elif agent_type == "momentum":
+        recent_events = get('recent_events', [])
+        fields['recent_events'] = ', '.join(recent_events) if recent_events else 'None'
+    elif agent_type == "tactical":
+        fields['recent_events'] = _dumps_text(get('recent_events', []))
+    if agent_type == "probability" or agent_type == "momentum":
+        fields['p_draw'] = get('p_draw', 0)
+        fields['p_sa_win'] = get('p_sa_win', 0)
+    
+    return _CONTEXT_TEMPLATES.get(agent_type, _DEFAULT_CONTEXT_TEMPLATE).format_map(fields)
+
+
+async def _create_completion(client: AsyncOpenAI, context: str) -> Optional[str]:
+    """
+    Send a single prompt to OpenAI.
+    
+    Transient failures are retried once, after a short delay, on the next
+    model in _COMPLETION_MODELS. Other API errors are logged and not retried.
+    
+    Args:
+        client: OpenAI client
+        context: Prompt built by _build_context
+    
+    Returns:
+        str: Model answer, or None if the API call fails (caller falls back to keyword matching)
+    """
+    for attempt, model in enumerate(_COMPLETION_MODELS):
+        if attempt:
+            await asyncio.sleep(_RETRY_DELAY * 2 ** (attempt - 1))
+        try:
+            response = await client.chat.completions.create(
+                model=model,
+                messages=[
+                    {"role": "system", "content": "You are a helpful cricket commentary assistant. Answer questions accurately and concisely."},
+                    {"role": "user", "content": context}
+                ],
+                max_tokens=150,
+                temperature=0.3,  # Lower temperature for more factual responses
+            )
+        except _TRANSIENT_ERRORS as e:
+            logger.warning("OpenAI request to %s failed: %s", model, type(e).__name__)
+            continue
+        except openai.APIError as e:
+            logger.warning("OpenAI request to %s failed: %s", model, e)
+            return None
         
-        answer = response.choices[0].message.content.strip()
+        content = response.choices[0].message.content
+        return content.strip() if content else None
+    
+    logger.warning("OpenAI unavailable after %d attempts, using keyword fallback", len(_COMPLETION_MODELS))
+    return None
+
+
+async def _fetch_response(
+    client: AsyncOpenAI,
+    query: str,
+    state_data: Dict[str, Any],
+    agent_type: str,
+    cache_key: CacheKey
+) -> Optional[str]:
+    """
+    Call OpenAI for a request that isn't cached, coalescing duplicates.
+    
+    If an identical request is already in flight, wait for its answer
+    instead of making a second API call.
+    
+    Returns:
+        str: Model answer, or None if the API call fails
+    """
+    loop = asyncio.get_running_loop()
+    loop_inflight = _inflight.get(loop)
+    if loop_inflight is None:
+        loop_inflight = _inflight[loop] = {}
+    
+    inflight = loop_inflight.get(cache_key)
+    if inflight is not None:
+        # Shield so a cancelled follower doesn't cancel the shared future
+        return await asyncio.shield(inflight)
+    
+    future = loop.create_future()
+    loop_inflight[cache_key] = future
+    answer = None
+    try:
+        context = _build_context(query, state_data, agent_type)
+        answer = await _create_completion(client, context)
         
         # Cache the response
-        _response_cache[cache_key] = answer
-        
-        return answer
+        if answer is not None:
+            _response_cache[cache_key] = answer
+    finally:
+        del loop_inflight[cache_key]
+        # Followers fall back to keyword answers if the leader failed
+        future.set_result(answer)
+    
+    return answer
+
+
+async def get_intelligent_response(
+    query: str,
+    state_data: Dict[str, Any],
+    agent_type: str = "stats"
+) -> Optional[str]:
+    """
+    Get intelligent response from OpenAI for a query.
+    
+    Uses caching to avoid redundant API calls for identical queries/states,
+    and concurrent identical requests share a single in-flight call.
+    
+    Args:
+        query: User's query
+        state_data: Current match state data
+        agent_type: Type of agent ("stats", "momentum", "probability", "tactical")
     
-    except Exception:
-        # If API call fails, return None (fallback to keyword matching)
+    Returns:
+        str: Intelligent response, or None if OpenAI unavailable
+    """
+    client = get_openai_client()
+    if not client:
         return None
+    
+    # Check cache first
+    cache_key = _get_cache_key(query, state_data, agent_type)
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        return cached
+    
+    return await _fetch_response(client, query, state_data, agent_type, cache_key)
+
+
+async def get_intelligent_responses(
+    requests: List[Tuple[str, Dict[str, Any], str]]
+) -> List[Optional[str]]:
+    """
+    Get intelligent responses for a batch of (query, state_data, agent_type) requests.
+    
+    Cached answers are served directly, identical requests share one API
+    call, and the remaining calls are issued concurrently so the whole
+    batch costs roughly one round trip. Requests are grouped by agent type
+    so prompts with a shared prefix are sent back to back.
+    
+    Args:
+        requests: List of (query, state_data, agent_type) tuples
+    
+    Returns:
+        List of responses in the same order as requests (None where unavailable)
+    """
+    results: List[Optional[str]] = [None] * len(requests)
+    
+    client = get_openai_client()
+    if not client:
+        return results
+    
+    # Map cache key -> indices waiting on it (dedupes identical requests)
+    pending: Dict[CacheKey, List[int]] = {}
+    for index, (query, state_data, agent_type) in sorted(
+        enumerate(requests), key=lambda item: item[1][2]
+    ):
+        cache_key = _get_cache_key(query, state_data, agent_type)
+        cached = _response_cache.get(cache_key)
+        if cached is not None:
+            results[index] = cached
+            continue
+        pending.setdefault(cache_key, []).append(index)
+    
+    fetches = []
+    for cache_key, indices in pending.items():
+        query, state_data, agent_type = requests[indices[0]]
+        fetches.append(_fetch_response(client, query, state_data, agent_type, cache_key))
+    answers = await asyncio.gather(*fetches)
+    
+    for indices, answer in zip(pending.values(), answers):
+        for index in indices:
+            results[index] = answer
+    
+    return results
+
+
+def cache_info() -> CacheInfo:
+    """Return response cache hits, misses, maxsize and current size."""
+    return _response_cache.cache_info()
 
 
 def clear_cache():
     """Clear the response cache."""
-    global _response_cache
-    _response_cache = {}
+    _response_cache.clear()
 
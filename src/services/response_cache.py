@@ -0,0 +1,193 @@
+"""
+TTL cache for LLM responses, in memory or backed by a shelve file.
+
+Answers are only valid while the match state they were generated for is
+current, so entries expire after a short TTL (roughly the time between
+balls) and the cache is bounded so a long session can't grow it forever.
+"""
+
+import atexit
+import hashlib
+import shelve
+import threading
+import time
+from collections import OrderedDict, namedtuple
+from typing import Any, Callable, Hashable, Optional, Tuple
+
+# Same shape as functools.lru_cache's cache_info()
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class TTLCache:
+    """
+    Bounded cache whose entries expire ttl seconds after being stored.
+
+    Every entry has the same TTL, so insertion order is also expiry order:
+    expired entries are dropped from the front, and the oldest entry is
+    evicted when maxsize is exceeded. Lookups are counted so the hit rate
+    can be checked with cache_info(). Access is locked, so the cache can be
+    shared by event loops running on different threads.
+
+    Example:
+        >>> cache = TTLCache(maxsize=1024, ttl=30)
+        >>> cache[("stats", "score?", b"...")] = "India are 27/2."
+        >>> cache.get(("stats", "score?", b"..."))
+        'India are 27/2.'
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 1024,
+        ttl: float = 30.0,
+        timer: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            maxsize: Maximum number of entries kept
+            ttl: Seconds an entry stays valid
+            timer: Clock used for expiry (monotonic by default)
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._timer = timer
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.RLock()
+
+    def _expire(self, now: float):
+        """Drop entries whose TTL has passed."""
+        while self._data:
+            expires_at, _ = next(iter(self._data.values()))
+            if expires_at > now:
+                break
+            self._evicted(self._data.popitem(last=False)[0])
+
+    def _evicted(self, key: Hashable):
+        """Called for each entry dropped by expiry or the size bound."""
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Optional[Any]:
+        """Return the cached value for key, or default if missing/expired."""
+        with self._lock:
+            self._expire(self._timer())
+            entry = self._data.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            self.hits += 1
+            return entry[1]
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            self._expire(self._timer())
+            return key in self._data
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            now = self._timer()
+            self._expire(now)
+            self._data.pop(key, None)
+            self._data[key] = (now + self.ttl, value)
+            while len(self._data) > self.maxsize:
+                self._evicted(self._data.popitem(last=False)[0])
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._expire(self._timer())
+            return len(self._data)
+
+    def cache_info(self) -> CacheInfo:
+        """Return hit/miss counts and current size (like functools.lru_cache)."""
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self))
+
+    def clear(self):
+        """Remove all entries and reset the counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+class PersistentTTLCache(TTLCache):
+    """
+    TTLCache that also writes its entries to a shelve file.
+
+    Entries still live in memory; the file lets a restarted process pick up
+    answers that haven't expired yet instead of paying for them again.
+    Expiry uses wall-clock time so it stays meaningful across processes,
+    and entries are removed from the file when they expire or are evicted.
+    Writes are not synced one by one; the file is synced when the cache is
+    closed, which also happens at interpreter exit.
+
+    Example:
+        >>> cache = PersistentTTLCache("/tmp/cricket_llm_cache", ttl=30)
+        >>> cache[("stats", "score?", b"...")] = "India are 27/2."
+        >>> cache.close()
+    """
+
+    def __init__(self, path: str, maxsize: int = 1024, ttl: float = 30.0):
+        """
+        Open (or create) the cache file and load its unexpired entries.
+
+        Args:
+            path: Shelve file path (the dbm backend may add a suffix)
+            maxsize: Maximum number of entries kept in memory
+            ttl: Seconds an entry stays valid
+        """
+        super().__init__(maxsize, ttl, timer=time.time)
+        self._shelf = shelve.open(path)
+        self._load()
+        atexit.register(self.close)
+
+    @staticmethod
+    def _shelf_key(key: Hashable) -> str:
+        """Shelve keys must be strings; use a digest of the key's repr."""
+        return hashlib.blake2b(repr(key).encode(), digest_size=16).hexdigest()
+
+    def _load(self):
+        """Read unexpired entries into memory and drop the rest from the file."""
+        now = self._timer()
+        entries = []
+        for shelf_key in list(self._shelf.keys()):
+            try:
+                key, expires_at, value = self._shelf[shelf_key]
+            except Exception:
+                # Unreadable (e.g. written by an incompatible version)
+                expires_at = now
+            if expires_at <= now:
+                del self._shelf[shelf_key]
+            else:
+                entries.append((expires_at, key, value))
+
+        # Same TTL for every entry, so sorting by expiry restores insertion order
+        entries.sort(key=lambda entry: entry[0])
+        overflow = max(len(entries) - self.maxsize, 0)
+        for _, key, _ in entries[:overflow]:
+            self._evicted(key)
+        for expires_at, key, value in entries[overflow:]:
+            self._data[key] = (expires_at, value)
+        self._shelf.sync()
+
+    def __setitem__(self, key: Hashable, value: Any):
+        with self._lock:
+            super().__setitem__(key, value)
+            expires_at, _ = self._data[key]
+            self._shelf[self._shelf_key(key)] = (key, expires_at, value)
+
+    def _evicted(self, key: Hashable):
+        self._shelf.pop(self._shelf_key(key), None)
+
+    def clear(self):
+        """Remove all entries (in memory and on disk) and reset the counters."""
+        with self._lock:
+            super().clear()
+            self._shelf.clear()
+            self._shelf.sync()
+
+    def close(self):
+        """Sync and close the cache file (safe to call more than once)."""
+        atexit.unregister(self.close)
+        with self._lock:
+            self._shelf.close()
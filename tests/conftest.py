@@ -0,0 +1,36 @@
+"""
+Shared pytest fixtures.
+
+clone_state is a plain function so script-mode entry points (which run
+without fixtures) can build the same per-test states.
+"""
+
+import dataclasses
+
+import pytest
+
+from src.core.state import MatchState, initialize_match_state
+
+# Start-of-Day-5 state, built once; tests work on clones of it
+BASE_STATE = initialize_match_state()
+
+
+def clone_state(state: MatchState = BASE_STATE) -> MatchState:
+    """A copy of state with its own event log and per-batter totals."""
+    return dataclasses.replace(
+        state,
+        recent_events=state.recent_events.copy(),
+        per_batter_runs=dict(state.per_batter_runs),
+    )
+
+
+@pytest.fixture(scope="session")
+def base_state():
+    """Start-of-Day-5 match state, shared by the whole test session (don't mutate it)."""
+    return BASE_STATE
+
+
+@pytest.fixture
+def match_state(base_state):
+    """A copy of base_state for one test, with its own event log and per-batter totals."""
+    return clone_state(base_state)
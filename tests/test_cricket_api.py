@@ -0,0 +1,136 @@
+"""
+Tests for the cricket API client.
+
+Runs offline - HTTP requests are answered by an httpx mock transport.
+"""
+
+import asyncio
+
+import httpx
+
+from src.services import cricket_api
+from src.services.cricket_api import CricketAPIClient
+
+
+def test_cricscore_match_id_is_reused_between_polls():
+    """After the first poll, only the score endpoint is requested."""
+    urls = []
+
+    def handler(request):
+        urls.append(str(request.url))
+        if request.url.params.get("id"):
+            return httpx.Response(200, json=[{"si": "India: 27/2 (6.0 ov)", "status": "Day 5"}])
+        return httpx.Response(200, json=[{"t1": "India", "t2": "South Africa", "id": 42}])
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+            client = CricketAPIClient(http_client=http)
+            first = await client.fetch_match_data()
+            second = await client.fetch_match_data()
+            return first, second
+
+    first, second = asyncio.run(run())
+
+    assert first == second
+    assert first["score"] == {"runs": 27, "wickets": 2}
+    assert first["overs"] == 6.0
+    assert urls == [
+        "https://cricscore-api.appspot.com/csa",
+        "https://cricscore-api.appspot.com/csa?id=42",
+        "https://cricscore-api.appspot.com/csa?id=42",
+    ]
+
+
+def test_parse_dismissals_reads_both_scorecard_layouts():
+    """Dismissals come from the flat batting list and from each innings."""
+    data = {"scorecard": {
+        "batting": [
+            {"name": "Jaiswal", "runs": "13", "status": "out", "bowler": "Jansen"},
+            {"name": "Sai Sudharsan", "runs": 15},
+        ],
+        "innings": [
+            {"batting": [{"name": "Rahul", "runs": 6, "dismissed": True, "overs_at_dismissal": "4.2"}]},
+            {"batting": None},
+        ],
+    }}
+
+    dismissed = CricketAPIClient()._parse_dismissals_from_cricbuzz(data)
+
+    assert [(p.name, p.runs, p.bowler) for p in dismissed] == [
+        ("Jaiswal", 13, "Jansen"),
+        ("Rahul", 6, "unknown"),
+    ]
+    assert dismissed[1].dismissed_at_overs == 4.2
+
+
+def test_backoff_doubles_and_caps(monkeypatch):
+    """Failed polls wait longer each time, up to MAX_POLL_BACKOFF plus jitter."""
+    monkeypatch.setattr(cricket_api.random, "uniform", lambda low, high: 0.0)
+
+    delays = [cricket_api._backoff_delay(30, failures) for failures in range(1, 8)]
+
+    assert delays == [30, 60, 120, 240, 300, 300, 300]
+
+
+def test_get_cricket_client_is_shared():
+    """The poller and the historical fetch get the same client for a match."""
+    client = cricket_api.get_cricket_client("117380", ("India", "South Africa"))
+
+    assert cricket_api.get_cricket_client("117380", ("India", "South Africa")) is client
+    assert cricket_api.get_cricket_client("1", ("India", "South Africa")) is not client
+
+
+def test_clients_share_one_connection_pool():
+    """Separate client instances reuse the loop's pool; the last aclose() closes it."""
+    async def run():
+        first, second = CricketAPIClient(), CricketAPIClient("1")
+        shared = first._http_client()
+        assert second._http_client() is shared
+
+        await first.aclose()
+        assert not shared.is_closed
+        assert second._http_client() is shared
+        await second.aclose()
+        assert shared.is_closed
+
+        reopened = CricketAPIClient()._http_client()
+        await cricket_api.aclose_shared_clients()
+        return shared, reopened
+
+    shared, reopened = asyncio.run(run())
+
+    assert reopened is not shared
+    assert reopened.is_closed
+
+
+def test_poller_queues_each_change_once(monkeypatch, match_state):
+    """The poller keeps its own baseline, so an unchanged score isn't re-queued."""
+    four = {"score": {"runs": 31, "wickets": 2}, "overs": 6.1}
+    single = {"score": {"runs": 32, "wickets": 2}, "overs": 6.2}
+    polls = iter([four, four, four, single, single])
+    client = CricketAPIClient("poller-test")
+
+    async def fake_fetch():
+        return next(polls, single)
+
+    monkeypatch.setattr(client, "fetch_match_data", fake_fetch)
+    monkeypatch.setattr(cricket_api, "get_cricket_client", lambda match_id, team_names: client)
+
+    async def run():
+        queue = asyncio.Queue()
+        poller = asyncio.create_task(
+            cricket_api.poll_cricket_api("poller-test", match_state, queue, poll_interval=0)
+        )
+        events = [await queue.get(), await queue.get()]
+        for _ in range(20):
+            await asyncio.sleep(0)
+        poller.cancel()
+        await asyncio.gather(poller, return_exceptions=True)
+        return events, queue.qsize()
+
+    (first, second), leftover = asyncio.run(run())
+
+    assert (first.runs_scored, second.runs_scored) == (4, 1)
+    assert leftover == 0
+    # The shared client itself stays stateless: it still diffs against the state given
+    assert client.detect_new_event(four, match_state).runs_scored == 4
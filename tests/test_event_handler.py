@@ -0,0 +1,93 @@
+"""
+Tests for batched event application.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.agents.event_handler import process_event_dict, process_event_sync, update_state, update_state_batch
+from src.core.state import Event
+
+
+def _events():
+    start = datetime(2025, 11, 26, 9, 30)
+    return [
+        Event(timestamp=start, event_type="runs", runs_scored=4, batter="Sai Sudharsan",
+              bowler="Jansen", overs_played=6.1, current_score=31, current_wickets=2, balls_in_over=1),
+        Event(timestamp=start + timedelta(minutes=1), event_type="runs", runs_scored=1, batter="Kuldeep Yadav",
+              bowler="Jansen", overs_played=6.2, current_score=32, current_wickets=2, balls_in_over=2),
+        Event(timestamp=start + timedelta(minutes=2), event_type="wicket", batter="Kuldeep Yadav",
+              bowler="Jansen", dismissal_mode="bowled", overs_played=6.3, current_score=32,
+              current_wickets=3, balls_in_over=3),
+    ]
+
+
+def test_batch_matches_one_event_at_a_time(match_state):
+    """A batch produces the same state as applying its events one by one."""
+    events = _events()
+    expected = match_state
+    for event in events:
+        expected = update_state(expected, event)
+
+    state = update_state_batch(match_state, events)
+
+    assert state.total_runs == expected.total_runs == 32
+    assert state.wickets_lost == expected.wickets_lost == 3
+    assert state.dismissed_players == expected.dismissed_players
+    assert state.per_batter_runs == expected.per_batter_runs
+    assert state.recent_wickets_10 == expected.recent_wickets_10
+    assert state.recent_runs_10 == expected.recent_runs_10
+    assert state.p_draw == expected.p_draw
+    assert list(state.recent_events) == list(expected.recent_events)
+
+
+def test_batch_rejects_invalid_transition(match_state):
+    """An invalid event anywhere in the batch fails the whole batch."""
+    events = _events()
+    events.append(Event(timestamp=datetime(2025, 11, 26, 9, 40), event_type="runs", runs_scored=1,
+                        overs_played=5.0, current_score=33, current_wickets=3, balls_in_over=1))
+
+    with pytest.raises(ValueError, match="Overs went backwards"):
+        update_state_batch(match_state, events)
+
+
+def test_json_event_matches_dict_event(match_state):
+    """A JSON event builds the same state as the equivalent dict (whichever parser is used)."""
+    event = {
+        "event_type": "runs", "timestamp": "2025-11-26T09:15:00+05:30", "batter": "Sai Sudharsan",
+        "bowler": "Marco Jansen", "runs_scored": "4", "current_score": 31, "current_wickets": 2,
+        "overs_played": 7.1, "balls_in_over": 1, "commentary": "Driven through covers",
+    }
+
+    from_json = process_event_sync(json.dumps(event), match_state)
+    from_dict = process_event_dict(dict(event), match_state)
+
+    assert list(from_json.recent_events) == list(from_dict.recent_events)
+    assert from_json.p_draw == from_dict.p_draw
+
+
+def test_json_event_errors_name_the_field(match_state):
+    """Invalid events still report which field is wrong."""
+    with pytest.raises(ValueError, match="Missing required field: timestamp"):
+        process_event_sync('{"event_type": "runs"}', match_state)
+    with pytest.raises(ValueError, match="balls_in_over must be between 1 and 6"):
+        process_event_sync(json.dumps({
+            "event_type": "runs", "timestamp": "2025-11-26T09:15:00", "current_score": 31,
+            "current_wickets": 2, "overs_played": 7.1, "balls_in_over": 9,
+        }), match_state)
+
+
+def test_fractional_counts_are_rejected(match_state):
+    """Integer fields reject non-integral numbers instead of truncating them."""
+    event = {
+        "event_type": "runs", "timestamp": "2025-11-26T09:15:00", "current_score": 31.7,
+        "current_wickets": 2, "overs_played": 7.1, "balls_in_over": 1,
+    }
+
+    with pytest.raises(ValueError, match="current_score must be a whole number"):
+        process_event_dict(dict(event), match_state)
+
+    event["current_score"] = 31.0
+    assert process_event_dict(dict(event), match_state).total_runs == 31
@@ -1,49 +1,57 @@
 """Quick test of free Cricscore API."""
 
-import requests
 import asyncio
-import sys
-import os
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+import httpx
+
+# Optional fast JSON parser, fed the raw response bytes (same as CricketAPIClient)
+try:
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 from src.core.state import initialize_match_state
 from src.services.cricket_api import CricketAPIClient
 
 def test_cricscore_direct():
     """Test Cricscore API directly."""
+    asyncio.run(_cricscore_direct())
+
+async def _cricscore_direct():
     print("Testing Cricscore API (FREE, no API key)...")
     print("=" * 50)
     
     try:
-        # Get list of matches
-        url = "https://cricscore-api.appspot.com/csa"
-        response = requests.get(url, timeout=5)
-        
-        if response.status_code == 200:
-            matches = response.json()
-            print(f"✅ API working! Found {len(matches)} live matches")
+        # One client for every call, so the score fetches reuse the list call's connection.
+        # The pool limit also caps concurrent requests, to stay polite to the free API.
+        async with httpx.AsyncClient(timeout=5, limits=httpx.Limits(max_connections=5)) as http:
+            # Get list of matches
+            url = "https://cricscore-api.appspot.com/csa"
+            response = await http.get(url)
             
-            if matches:
-                print("\nSample matches:")
-                for match in matches[:5]:
-                    print(f"  ID: {match.get('id')}, Teams: {match.get('t1')} vs {match.get('t2')}")
+            if response.status_code == 200:
+                matches = _json_loads(response.content)
+                print(f"✅ API working! Found {len(matches)} live matches")
                 
-                # Try to get score for first match
                 if matches:
-                    match_id = matches[0].get('id')
-                    score_url = f"https://cricscore-api.appspot.com/csa?id={match_id}"
-                    score_response = requests.get(score_url, timeout=5)
+                    print("\nSample matches:")
+                    for match in matches[:5]:
+                        print(f"  ID: {match.get('id')}, Teams: {match.get('t1')} vs {match.get('t2')}")
                     
-                    if score_response.status_code == 200:
-                        score_data = score_response.json()
-                        print(f"\n✅ Score fetch working!")
-                        print(f"   Sample score data: {score_data[0] if score_data else 'No data'}")
+                    # Fetch the sample matches' scores concurrently
+                    score_responses = await asyncio.gather(*(
+                        http.get(url, params={"id": match.get('id')}) for match in matches[:5]
+                    ))
+                    
+                    for match, score_response in zip(matches, score_responses):
+                        if score_response.status_code == 200:
+                            score_data = _json_loads(score_response.content)
+                            print(f"\n✅ Score fetch working for match {match.get('id')}!")
+                            print(f"   Sample score data: {score_data[0] if score_data else 'No data'}")
+                else:
+                    print("ℹ️  No live matches currently")
             else:
-                print("ℹ️  No live matches currently")
-        else:
-            print(f"❌ API returned status: {response.status_code}")
+                print(f"❌ API returned status: {response.status_code}")
     
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -0,0 +1,102 @@
+"""
+Tests for the LLM micro-batcher.
+
+Runs without an OpenAI key - the batch executor is replaced with a stub.
+"""
+
+import asyncio
+
+import pytest
+
+from src.services import llm_batcher as batcher_module
+from src.services.llm_batcher import LLMBatcher
+
+
+def test_concurrent_submits_share_one_batch(monkeypatch):
+    """Requests submitted together are answered by a single batch call."""
+    calls = []
+
+    async def fake_responses(requests):
+        calls.append(requests)
+        return [f"{agent_type}: {query}" for query, _, agent_type in requests]
+
+    monkeypatch.setattr(batcher_module, "get_intelligent_responses", fake_responses)
+
+    async def run():
+        batcher = LLMBatcher(max_batch=16, max_wait_ms=5)
+        return await asyncio.gather(
+            batcher.submit("What's the score?", {}, agent_type="stats"),
+            batcher.submit("Can India draw?", {}, agent_type="probability"),
+        )
+
+    results = asyncio.run(run())
+
+    assert results == ["stats: What's the score?", "probability: Can India draw?"]
+    assert len(calls) == 1
+
+
+def test_full_batch_flushes_immediately(monkeypatch):
+    """Reaching max_batch flushes without waiting for the timer."""
+    calls = []
+
+    async def fake_responses(requests):
+        calls.append(len(requests))
+        return [None] * len(requests)
+
+    monkeypatch.setattr(batcher_module, "get_intelligent_responses", fake_responses)
+
+    async def run():
+        batcher = LLMBatcher(max_batch=2, max_wait_ms=10_000)
+        return await asyncio.wait_for(
+            asyncio.gather(
+                batcher.submit("a", {}),
+                batcher.submit("b", {}),
+            ),
+            timeout=1,
+        )
+
+    assert asyncio.run(run()) == [None, None]
+    assert calls == [2]
+
+
+def test_shared_batcher_keeps_loops_apart(monkeypatch):
+    """Each event loop gets its own batcher; a batcher rejects a second loop."""
+    async def fake_responses(requests):
+        return [query for query, _, _ in requests]
+
+    monkeypatch.setattr(batcher_module, "get_intelligent_responses", fake_responses)
+    shared = batcher_module._PerLoopBatcher(max_batch=16, max_wait_ms=5)
+
+    async def run():
+        return await shared.submit("a", {}), shared.for_loop(asyncio.get_running_loop())
+
+    first_answer, first = asyncio.run(run())
+    second_answer, second = asyncio.run(run())
+
+    assert first_answer == second_answer == "a"
+    assert first is not second
+
+    with pytest.raises(RuntimeError, match="different event loop"):
+        asyncio.run(first.submit("b", {}))
+
+
+def test_batches_in_flight_are_referenced(monkeypatch):
+    """The batcher keeps each running batch task alive until it finishes."""
+    started = []
+
+    async def fake_responses(requests):
+        started.append(len(requests))
+        await asyncio.sleep(0.01)
+        return [None] * len(requests)
+
+    monkeypatch.setattr(batcher_module, "get_intelligent_responses", fake_responses)
+
+    async def run():
+        batcher = LLMBatcher(max_batch=1, max_wait_ms=10)
+        pending = asyncio.ensure_future(batcher.submit("What's the score?", {}))
+        await asyncio.sleep(0)
+        in_flight = len(batcher._tasks)
+        await pending
+        return in_flight, len(batcher._tasks)
+
+    assert asyncio.run(run()) == (1, 0)
@@ -0,0 +1,213 @@
+"""
+Tests for LLM client caching and request coalescing.
+
+Runs without an OpenAI key - the client and completion call are stubbed.
+"""
+
+import asyncio
+import types
+
+import httpx
+import openai
+
+from src.services import llm_client
+from src.services.response_cache import PersistentTTLCache, TTLCache
+
+
+def test_concurrent_identical_requests_share_one_call(monkeypatch):
+    """Identical in-flight requests are answered by a single API call."""
+    calls = []
+
+    async def fake_completion(client, context):
+        calls.append(context)
+        await asyncio.sleep(0.05)
+        return "India are 27/2."
+
+    monkeypatch.setattr(llm_client, "get_openai_client", lambda: object())
+    monkeypatch.setattr(llm_client, "_create_completion", fake_completion)
+    llm_client.clear_cache()
+
+    state_data = {"total_runs": 27, "wickets_lost": 2, "overs_played": 6.0}
+
+    async def run():
+        return await asyncio.gather(
+            llm_client.get_intelligent_response("What's the score?", state_data, "stats"),
+            llm_client.get_intelligent_response("What's the score?", state_data, "stats"),
+        )
+
+    assert asyncio.run(run()) == ["India are 27/2.", "India are 27/2."]
+    assert len(calls) == 1
+    llm_client.clear_cache()
+
+
+def test_ttl_cache_expires_entries():
+    """Cached responses disappear once their TTL has passed."""
+    now = [0.0]
+    cache = TTLCache(maxsize=2, ttl=30, timer=lambda: now[0])
+
+    cache["a"] = "first"
+    now[0] = 29.0
+    assert cache.get("a") == "first"
+
+    now[0] = 30.0
+    assert cache.get("a") is None
+
+
+def test_persistent_cache_survives_reopen(tmp_path):
+    """Unexpired answers are read back from disk by a new cache instance."""
+    path = str(tmp_path / "llm_cache")
+    key = ("stats", "score?", b"\x01\x02")
+
+    cache = PersistentTTLCache(path, ttl=30)
+    cache[key] = "India are 27/2."
+    cache.close()
+
+    reopened = PersistentTTLCache(path, ttl=30)
+    assert reopened.get(key) == "India are 27/2."
+    reopened.clear()
+    reopened.close()
+
+    emptied = PersistentTTLCache(path, ttl=30)
+    assert emptied.get(key) is None
+    emptied.close()
+
+
+def test_persistent_cache_prunes_evicted_entries(tmp_path):
+    """Entries evicted by the size bound are removed from the file too."""
+    path = str(tmp_path / "llm_cache")
+
+    cache = PersistentTTLCache(path, maxsize=2, ttl=30)
+    for key in ("a", "b", "c"):
+        cache[key] = key.upper()
+
+    assert len(cache._shelf) == 2
+    assert cache._shelf_key("a") not in cache._shelf
+    cache.close()
+    cache.close()
+
+
+def test_cache_key_depends_on_agent_type_and_state():
+    """Same query for a different agent or state gets a different key."""
+    state_data = {"total_runs": 27, "wickets_lost": 2}
+
+    key = llm_client._get_cache_key("Score?", state_data, "stats")
+
+    assert key == llm_client._get_cache_key(" score? ", dict(state_data), "stats")
+    assert key != llm_client._get_cache_key("Score?", state_data, "probability")
+    assert key != llm_client._get_cache_key("Score?", {**state_data, "total_runs": 31}, "stats")
+
+
+def test_state_fingerprint_is_reused_per_dict(monkeypatch):
+    """A state dict is serialized once, however many keys are built from it."""
+    encoded = []
+    dumps = llm_client._dumps_sorted
+
+    def counting_dumps(data):
+        encoded.append(data)
+        return dumps(data)
+
+    monkeypatch.setattr(llm_client, "_dumps_sorted", counting_dumps)
+    state_data = {"total_runs": 27, "wickets_lost": 2}
+
+    llm_client._get_cache_key("Score?", state_data, "stats")
+    llm_client._get_cache_key("Who is batting?", state_data, "stats")
+
+    assert len(encoded) == 1
+
+
+def test_ttl_cache_counts_hits_and_misses():
+    """cache_info reports lookups the same way functools.lru_cache does."""
+    cache = TTLCache(maxsize=4, ttl=30, timer=lambda: 0.0)
+
+    cache.get("a")
+    cache["a"] = "first"
+    cache.get("a")
+
+    assert cache.cache_info() == (1, 1, 4, 1)
+
+
+def test_openai_client_is_reused_until_reset(monkeypatch):
+    """One client per event loop, rebuilt after reset_openai_client()."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    llm_client.reset_openai_client()
+
+    async def run():
+        first = llm_client.get_openai_client()
+        second = llm_client.get_openai_client()
+        llm_client.reset_openai_client()
+        return first, second, llm_client.get_openai_client()
+
+    first, second, rebuilt = asyncio.run(run())
+
+    assert first is second
+    assert rebuilt is not first
+    assert first.is_closed()
+    llm_client.reset_openai_client()
+
+
+def test_openai_client_outside_loop_is_shared_and_closed(monkeypatch):
+    """Callers without a running loop share one client; reset closes it."""
+    monkeypatch.setenv("OPENAI_API_KEY", "sk-test")
+    llm_client.reset_openai_client()
+
+    client = llm_client.get_openai_client()
+    assert llm_client.get_openai_client() is client
+
+    llm_client.reset_openai_client()
+    assert client.is_closed()
+    assert llm_client.get_openai_client() is not client
+    llm_client.reset_openai_client()
+
+
+def test_transient_failure_retries_on_fallback_model(monkeypatch):
+    """A connection error is retried once, on the next model."""
+    models = []
+
+    class FakeCompletions:
+        async def create(self, model, **kwargs):
+            models.append(model)
+            if len(models) == 1:
+                raise openai.APIConnectionError(request=httpx.Request("POST", "https://api.openai.com"))
+            message = types.SimpleNamespace(content=" India are 27/2. ")
+            return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)])
+
+    client = types.SimpleNamespace(chat=types.SimpleNamespace(completions=FakeCompletions()))
+    monkeypatch.setattr(llm_client, "_RETRY_DELAY", 0)
+
+    answer = asyncio.run(llm_client._create_completion(client, "What's the score?"))
+
+    assert answer == "India are 27/2."
+    assert models == list(llm_client._COMPLETION_MODELS)
+
+
+def test_inflight_requests_are_not_shared_across_loops(monkeypatch):
+    """A request on another event loop makes its own call instead of awaiting a foreign future."""
+    calls = []
+
+    async def fake_completion(client, context):
+        calls.append(context)
+        await asyncio.sleep(0.05)
+        return "India are 27/2."
+
+    monkeypatch.setattr(llm_client, "get_openai_client", lambda: object())
+    monkeypatch.setattr(llm_client, "_create_completion", fake_completion)
+    llm_client.clear_cache()
+
+    state_data = {"total_runs": 27, "wickets_lost": 2, "overs_played": 6.0}
+
+    async def ask():
+        return await llm_client.get_intelligent_response("Score?", state_data, "stats")
+
+    async def run():
+        leader = asyncio.ensure_future(ask())
+        await asyncio.sleep(0.01)
+        # Same request from another thread's loop while ours is in flight
+        return await asyncio.gather(leader, asyncio.to_thread(asyncio.run, ask()))
+
+    try:
+        answers = asyncio.run(run())
+    finally:
+        llm_client.clear_cache()
+
+    assert answers == ["India are 27/2.", "India are 27/2."]
+    assert len(calls) == 2
@@ -4,14 +4,24 @@ Quick test to verify OpenAI integration is working.
 
 import asyncio
 import os
+
+import pytest
 from dotenv import load_dotenv
-from models.state import initialize_match_state
-from agents.stats_agent import get_stats_response_async
-from utils.llm_client import get_openai_client
+from src.core.state import initialize_match_state
+from src.agents.stats_agent import get_stats_response_async
+from src.services.llm_client import get_openai_client
 
 load_dotenv()
 
-async def test():
+@pytest.mark.skipif(
+    not os.getenv("RUN_LIVE_OPENAI"),
+    reason="makes a live, paid OpenAI call; set RUN_LIVE_OPENAI=1 to run it",
+)
+def test_openai_integration():
+    """Check the OpenAI key, client reuse and one agent query."""
+    asyncio.run(_check_openai_integration())
+
+async def _check_openai_integration():
     print("Testing OpenAI Integration...")
     print("=" * 50)
     
@@ -32,6 +42,9 @@ async def test():
     
     print("✅ OpenAI client created successfully")
     
+    # The agents get the same cached client (and its warm connection pool)
+    assert get_openai_client() is client
+    
     # Test with a query
     state = initialize_match_state()
     query = "how many runs to win"
@@ -49,5 +62,5 @@ async def test():
         traceback.print_exc()
 
 if __name__ == "__main__":
-    asyncio.run(test())
+    asyncio.run(_check_openai_integration())
 